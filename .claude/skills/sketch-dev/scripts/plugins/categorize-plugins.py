@@ -14,6 +14,18 @@ import yaml
 import os
 import sys
 import re
+from functools import lru_cache
+
+try:
+    import ahocorasick  # pip install pyahocorasick
+except ImportError:
+    ahocorasick = None
+
+# C-accelerated dumper (libyaml) when available; ~5-10x faster serialization
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
 
 # Category definitions with priority-ordered keyword patterns
 # More specific patterns should come first
@@ -172,6 +184,105 @@ CATEGORIES = {
 }
 
 
+# Compiled keyword alternations, one pattern per category, in priority order.
+# A single C-level regex scan per category replaces hundreds of interpreted
+# substring tests per plugin. IGNORECASE avoids lowercasing text per call.
+COMPILED_CATEGORIES = [
+    (category, re.compile("|".join(re.escape(k) for k in keywords), re.IGNORECASE))
+    for category, keywords in CATEGORIES.items()
+]
+
+# Pre-bound search methods keep the fallback loop free of per-iteration
+# attribute lookups; the remaining interpreter work is one call per category.
+# Each entry carries a signature: the set of characters its keywords start
+# with (both cases). A category whose signature is disjoint from the text's
+# character set cannot match, so its regex scan is skipped entirely.
+CATEGORY_SEARCHES = [
+    (
+        category,
+        frozenset(k[0] for k in CATEGORIES[category])
+        | frozenset(k[0].upper() for k in CATEGORIES[category]),
+        pattern.search,
+    )
+    for category, pattern in COMPILED_CATEGORIES
+]
+
+# Used for the Exports vs Imports conflict check
+IMPORT_PATTERN = re.compile("import", re.IGNORECASE)
+
+# Category name -> priority index (lower wins, matching dict order)
+CATEGORY_PRIORITY = {category: i for i, category in enumerate(CATEGORIES)}
+
+
+def _build_automaton():
+    """Build an Aho-Corasick automaton over all keywords (keyword -> category)."""
+    automaton = ahocorasick.Automaton()
+    for category, keywords in CATEGORIES.items():
+        priority = CATEGORY_PRIORITY[category]
+        for keyword in keywords:
+            keyword = keyword.lower()
+            # Keep the highest-priority category for duplicate keywords
+            if not automaton.exists(keyword) or priority < automaton.get(keyword)[0]:
+                automaton.add_word(keyword, (priority, category))
+    automaton.make_automaton()
+    return automaton
+
+
+# Single automaton pass finds all keyword matches in O(len(text)).
+# Falls back to the per-category regex scan when pyahocorasick is missing.
+AUTOMATON = _build_automaton() if ahocorasick is not None else None
+
+
+def _categorize_with_automaton(text: str) -> str:
+    """Pick the highest-priority matching category via one automaton scan."""
+    best = None
+    best_non_exports = None
+
+    for _, (priority, category) in AUTOMATON.iter(text.lower()):
+        if best is None or priority < best[0]:
+            if priority == 0:
+                # Top-priority category matched; nothing can beat it
+                # (and it is not Exports, so no conflict check needed)
+                return category
+            best = (priority, category)
+        if category != "Exports" and (
+            best_non_exports is None or priority < best_non_exports[0]
+        ):
+            best_non_exports = (priority, category)
+
+    if best is None:
+        return "Other"
+
+    # Special handling for Exports vs Imports conflict: "import" is the
+    # Imports keyword, so an Imports match means the conflict applies.
+    if best[1] == "Exports" and IMPORT_PATTERN.search(text):
+        return best_non_exports[1] if best_non_exports else "Other"
+
+    return best[1]
+
+
+@lru_cache(maxsize=None)
+def _categorize(name: str, desc: str) -> str:
+    """Categorize by name/description text. Memoized: plugin lists carry
+    exact duplicates across scrapes, so repeats cost a dict lookup."""
+    text = f"{name} {desc}"
+
+    if AUTOMATON is not None:
+        return _categorize_with_automaton(text)
+
+    text_chars = frozenset(text)
+    for category, signature, search in CATEGORY_SEARCHES:
+        if signature.isdisjoint(text_chars):
+            continue
+        if search(text):
+            # Special handling for Exports vs Imports conflict
+            if category == "Exports" and IMPORT_PATTERN.search(text):
+                continue
+            return category
+
+    return "Other"
+
+
 def categorize_plugin(plugin: dict) -> str:
     """
     Categorize a plugin based on its name and description.
@@ -182,19 +293,7 @@ def categorize_plugin(plugin: dict) -> str:
     Returns:
         Category name string
     """
-    name = plugin.get("name", "").lower()
-    desc = plugin.get("description", "").lower()
-    text = f"{name} {desc}"
-
-    for category, keywords in CATEGORIES.items():
-        for keyword in keywords:
-            if keyword.lower() in text:
-                # Special handling for Exports vs Imports conflict
-                if category == "Exports" and "import" in text:
-                    continue
-                return category
-
-    return "Other"
+    return _categorize(plugin.get("name", ""), plugin.get("description", ""))
 
 
 def to_filename(category: str) -> str:
@@ -216,47 +315,59 @@ def main(input_file: str, output_dir: str):
 
     print(f"Loaded {len(plugins)} plugins from {input_file}")
 
-    # Categorize
-    categorized = {}
-    for plugin in plugins:
-        category = categorize_plugin(plugin)
-        if category not in categorized:
-            categorized[category] = []
-
-        is_github = "github.com" in plugin.get("link", "").lower()
+    # Ensure output directory exists
+    os.makedirs(output_dir, exist_ok=True)
 
-        categorized[category].append({
-            "plugin": plugin["name"],
-            "link": plugin["link"],
-            "description": plugin["description"],
-            "summary": f"By {plugin['author']}. Last updated {plugin['updated']}.",
-            "open-source": is_github,
-            "tags": [to_filename(category)]
-        })
+    # Categorize and stream each entry straight into its category file.
+    # Concatenated single-item yaml.dump calls form one valid sequence, so
+    # only one entry is materialized at a time instead of the whole list.
+    handles = {}
+    counts = {}
+    try:
+        for plugin in plugins:
+            category = categorize_plugin(plugin)
+
+            # extract-plugins.py already normalized this; only fall back to a
+            # lowered-copy substring test for inputs from other sources
+            is_github = plugin.get("is_github")
+            if is_github is None:
+                is_github = "github.com" in plugin.get("link", "").lower()
+
+            f = handles.get(category)
+            if f is None:
+                filepath = os.path.join(output_dir, to_filename(category) + ".yml")
+                f = open(filepath, "w", encoding="utf-8")
+                f.write("---\n")
+                handles[category] = f
+
+            yaml.dump([{
+                "plugin": plugin["name"],
+                "link": plugin["link"],
+                "description": plugin["description"],
+                "summary": f"By {plugin['author']}. Last updated {plugin['updated']}.",
+                "open-source": is_github,
+                "tags": [to_filename(category)]
+            }], f, Dumper=YamlDumper, default_flow_style=False,
+                allow_unicode=True, sort_keys=False)
+
+            counts[category] = counts.get(category, 0) + 1
+    finally:
+        for f in handles.values():
+            f.close()
 
     # Print summary
     print("\nCategory Distribution:")
     print("-" * 50)
-    for cat, items in sorted(categorized.items(), key=lambda x: -len(x[1])):
-        print(f"  {cat}: {len(items)}")
-
-    # Ensure output directory exists
-    os.makedirs(output_dir, exist_ok=True)
-
-    # Write YAML files
-    for category, items in categorized.items():
-        filename = to_filename(category) + ".yml"
-        filepath = os.path.join(output_dir, filename)
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write("---\n")
-            yaml.dump(items, f, default_flow_style=False,
-                      allow_unicode=True, sort_keys=False)
+    for cat, count in sorted(counts.items(), key=lambda x: -x[1]):
+        print(f"  {cat}: {count}")
 
-        print(f"Wrote {filepath} ({len(items)} plugins)")
+    print()
+    for category, count in counts.items():
+        filepath = os.path.join(output_dir, to_filename(category) + ".yml")
+        print(f"Wrote {filepath} ({count} plugins)")
 
-    total = sum(len(v) for v in categorized.values())
-    print(f"\nTotal: {total} plugins in {len(categorized)} files")
+    total = sum(counts.values())
+    print(f"\nTotal: {total} plugins in {len(counts)} files")
 
 
 if __name__ == "__main__":
@@ -10,9 +10,22 @@ Usage:
 """
 
 import json
-import re
+import mmap
 import sys
 
+# The third-party 'regex' module is a drop-in replacement for stdlib re with
+# a faster matching engine for lazy-quantifier-heavy patterns like ours.
+try:
+    import regex as re
+except ImportError:
+    import re
+
+# Optional fast JSON serializer (pip install orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Regex pattern for developer plugins
 # Format: "### [ Plugin Name  Updated on DATE Description  by Author ](URL)"
@@ -45,6 +58,17 @@ OFFICIAL_PATTERN = re.compile(
 )
 
 
+def is_github_link(link: str) -> bool:
+    """
+    Check whether a link points at github.com.
+
+    The plain substring test hits C code directly; scraped URLs are
+    almost always lowercase already, so the .lower() copy is only
+    allocated on the rare mixed-case miss.
+    """
+    return "github.com" in link or "github.com" in link.lower()
+
+
 def extract_plugins(markdown: str) -> list:
     """
     Extract plugin data from markdown content.
@@ -65,7 +89,7 @@ def extract_plugins(markdown: str) -> list:
             "description": match.group(3).strip(),
             "author": match.group(4).strip(),
             "link": match.group(5).strip(),
-            "is_github": "github.com" in match.group(5).lower()
+            "is_github": is_github_link(match.group(5))
         })
 
     return plugins
@@ -90,7 +114,7 @@ def extract_official_plugins(markdown: str) -> list:
             "author": match.group(3).strip(),
             "link": match.group(4).strip(),
             "updated": "Official",
-            "is_github": "github.com" in match.group(4).lower()
+            "is_github": is_github_link(match.group(4))
         })
 
     return plugins
@@ -104,9 +128,15 @@ def main(input_file: str, output_file: str):
         input_file: Path to markdown file
         output_file: Path for JSON output
     """
-    # Load markdown
-    with open(input_file, "r", encoding="utf-8") as f:
-        markdown = f.read()
+    # Load markdown via mmap: the kernel pages the crawl dump straight into
+    # our address space and the single decode is the only copy we make.
+    # (The extraction patterns are str patterns, so we do need that decode.)
+    with open(input_file, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                markdown = mm.read().decode("utf-8")
+        except ValueError:  # empty files cannot be mapped
+            markdown = ""
 
     print(f"Loaded {len(markdown)} characters from {input_file}")
 
@@ -120,19 +150,22 @@ def main(input_file: str, output_file: str):
     # Combine (official first)
     all_plugins = official + plugins
 
-    # Remove duplicates by link
-    seen = set()
-    unique_plugins = []
+    # Remove duplicates by link; setdefault keeps the first occurrence
+    # (official entries win over developer listings of the same repo)
+    unique = {}
     for p in all_plugins:
-        if p["link"] not in seen:
-            seen.add(p["link"])
-            unique_plugins.append(p)
+        unique.setdefault(p["link"], p)
+    unique_plugins = list(unique.values())
 
     print(f"Total unique plugins: {len(unique_plugins)}")
 
-    # Save to JSON
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(unique_plugins, f, indent=2, ensure_ascii=False)
+    # Save to JSON (orjson serializes straight to UTF-8 bytes when installed)
+    if orjson is not None:
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(unique_plugins, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(unique_plugins, f, indent=2, ensure_ascii=False)
 
     print(f"Saved to {output_file}")
 
@@ -27,24 +27,145 @@ Requirements:
 """
 
 import argparse
+import hashlib
 import json
 import os
 import re
+import shutil
 import subprocess
 import sys
+import threading
 import time
 import yaml
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# C-accelerated loader (libyaml) when available; ~10x faster parsing
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+from functools import lru_cache
+from html.parser import HTMLParser
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass, asdict
 
+# Optional in-process HTTP client (pip install httpx OR requests).
+# Avoids forking a gh/curl subprocess for every API call.
+try:
+    import httpx as _http
+except ImportError:
+    try:
+        import requests as _http
+    except ImportError:
+        _http = None
+
+# Optional fast HTML parser (pip install selectolax)
+try:
+    from selectolax.parser import HTMLParser as _SelectolaxParser
+except ImportError:
+    _SelectolaxParser = None
+
+# Resolved once at import: the fallback fetch path consults this instead
+# of paying a PATH walk (or a doomed fork) per page when curl is absent
+CURL_AVAILABLE = shutil.which("curl") is not None
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
 
-# Rate limiting
-GITHUB_DELAY = 0.5  # Seconds between GitHub API calls
-LLM_DELAY = 1.0     # Seconds between LLM calls
+    acquire() blocks until a token is available. Short bursts up to
+    `capacity` go through immediately, while the long-run rate is held to
+    `rate` tokens/second — unlike a fixed sleep, which pays the full delay
+    on every call even when traffic is sparse, and which concurrent
+    fetchers would each apply independently.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# Rate limiting: 2 GitHub calls/s with small bursts, 1 LLM call/s
+GITHUB_LIMITER = TokenBucket(rate=2.0, capacity=4)
+LLM_LIMITER = TokenBucket(rate=1.0, capacity=2)
+
+# LLM settings
+ANTHROPIC_MODEL = "claude-sonnet-4-20250514"
+SUMMARY_MAX_TOKENS = 500
+BATCH_POLL_INTERVAL = 5.0   # Initial seconds between batch status checks
+BATCH_POLL_MAX = 60.0       # Polling backs off exponentially up to this
+BATCH_CHUNK_SIZE = 500      # Requests per batch submission
+
+# Concurrent content fetches (network-bound, so threads work well)
+FETCH_WORKERS = 8
+
+# On-disk cache for fetched READMEs/homepages; re-runs over the same
+# plugin list skip the network entirely for anything already fetched.
+# Entries younger than CACHE_TTL are reused as-is; older entries are
+# revalidated with If-None-Match when the server gave us an ETag.
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "sketch-plugin-fetch"
+CACHE_TTL = 24 * 3600  # Seconds before an entry needs revalidation
+
+# Toggled by --no-cache
+_cache_enabled = True
+
+
+def cache_is_fresh(payload: dict) -> bool:
+    """Whether a cached payload is young enough to reuse without revalidation."""
+    return time.time() - payload.get("fetched_at", 0) < CACHE_TTL
+
+
+def _cache_path(kind: str, url: str) -> Path:
+    digest = hashlib.sha256(url.encode()).hexdigest()[:16]
+    return CACHE_DIR / f"{kind}-{digest}.json"
+
+
+def cache_get(kind: str, url: str) -> Optional[dict]:
+    """Look up a cached fetch. Returns the payload dict or None."""
+    if not _cache_enabled:
+        return None
+    try:
+        data = json.loads(_cache_path(kind, url).read_text(encoding="utf-8"))
+        if data.get("url") == url:  # guard against hash-prefix collisions
+            return data
+    except (OSError, ValueError):
+        pass
+    return None
 
 
-@dataclass
+def cache_put(kind: str, url: str, content: str, **extra):
+    """Store a successful fetch in the cache (failures are never cached)."""
+    if not _cache_enabled:
+        return
+    payload = {"url": url, "fetched_at": time.time(), "content": content, **extra}
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _cache_path(kind, url).write_text(
+            json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    except OSError:
+        pass
+
+
+@dataclass(slots=True)
 class PluginContent:
     """Fetched content for a plugin."""
     name: str
@@ -61,6 +182,52 @@ class PluginContent:
     def to_dict(self) -> dict:
         return {k: v for k, v in asdict(self).items() if v is not None}
 
+    def release_content(self):
+        """Drop the fetched README/homepage once a prompt embeds it."""
+        self.readme = None
+        self.homepage = None
+
+
+@lru_cache(maxsize=1)
+def get_http_client():
+    """
+    Shared HTTP client so TCP/TLS connections are pooled across fetches.
+
+    Both httpx.Client and requests.Session are thread-safe, so the fetch
+    worker pool can use one instance. Returns None when neither library
+    is installed.
+    """
+    if _http is None:
+        return None
+    if _http.__name__ == "httpx":
+        return _http.Client(follow_redirects=True, timeout=10)
+    return _http.Session()
+
+
+@lru_cache(maxsize=1)
+def get_github_token() -> Optional[str]:
+    """Get a GitHub token from the environment or the gh CLI (cached)."""
+    token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+    if token:
+        return token
+    try:
+        result = subprocess.run(
+            ["gh", "auth", "token"],
+            capture_output=True, text=True, timeout=5
+        )
+        if result.returncode == 0:
+            return result.stdout.strip() or None
+    except Exception:
+        pass
+    return None
+
+
+def truncate_readme(content: str, limit: int = 8000) -> str:
+    """Truncate very long READMEs."""
+    if len(content) > limit:
+        return content[:limit] + "\n\n[... truncated ...]"
+    return content
+
 
 def fetch_github_readme(repo_url: str, verbose: bool = True) -> Optional[str]:
     """Fetch README content from GitHub repo."""
@@ -71,6 +238,50 @@ def fetch_github_readme(repo_url: str, verbose: bool = True) -> Optional[str]:
     owner, repo = match.groups()
     repo = repo.removesuffix(".git").split("#")[0]
 
+    cached = cache_get("readme", repo_url)
+    if cached is not None and cache_is_fresh(cached):
+        return cached["content"]
+
+    # Direct API call (no subprocess) when an HTTP client is installed
+    if _http is not None:
+        headers = {
+            "Accept": "application/vnd.github.raw+json",
+            "User-Agent": "sketch-dev-plugin-tracker",
+        }
+        token = get_github_token()
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        if cached is not None and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        try:
+            resp = get_http_client().get(
+                f"https://api.github.com/repos/{owner}/{repo}/readme",
+                headers=headers, timeout=15
+            )
+            if resp.headers.get("X-RateLimit-Remaining") == "0":
+                reset = resp.headers.get("X-RateLimit-Reset", "")
+                if verbose:
+                    print(f"  Warning: GitHub rate limit exhausted "
+                          f"(resets at epoch {reset})", file=sys.stderr)
+            if resp.status_code == 304:
+                # Unchanged upstream; refresh the timestamp and reuse
+                cache_put("readme", repo_url, cached["content"], etag=cached.get("etag"))
+                return cached["content"]
+            if resp.status_code == 200 and resp.text:
+                content = truncate_readme(resp.text)
+                etag = resp.headers.get("ETag")
+                if etag:
+                    cache_put("readme", repo_url, content, etag=etag)
+                else:
+                    cache_put("readme", repo_url, content)
+                return content
+        except Exception as e:
+            if verbose:
+                print(f"  Warning: Failed to fetch README: {e}", file=sys.stderr)
+        # Stale cache beats nothing when the network is down
+        return cached["content"] if cached is not None else None
+
+    # Fallback: gh CLI subprocess
     try:
         result = subprocess.run(
             ["gh", "api", f"repos/{owner}/{repo}/readme",
@@ -78,66 +289,121 @@ def fetch_github_readme(repo_url: str, verbose: bool = True) -> Optional[str]:
             capture_output=True, text=True, timeout=15
         )
         if result.returncode == 0 and result.stdout:
-            content = result.stdout
-            # Truncate very long READMEs
-            if len(content) > 8000:
-                content = content[:8000] + "\n\n[... truncated ...]"
+            content = truncate_readme(result.stdout)
+            cache_put("readme", repo_url, content)
             return content
     except Exception as e:
         if verbose:
             print(f"  Warning: Failed to fetch README: {e}", file=sys.stderr)
 
-    return None
+    return cached["content"] if cached is not None else None
 
 
-def fetch_webpage_content(url: str) -> Optional[str]:
-    """Fetch and extract text from a webpage using curl + simple extraction."""
-    try:
-        result = subprocess.run(
-            ["curl", "-sL", "-m", "10", url],
-            capture_output=True, text=True, timeout=15
-        )
-        if result.returncode == 0 and result.stdout:
-            html = result.stdout
-            # Very basic text extraction (strip tags)
-            text = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-            text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
-            text = re.sub(r'<[^>]+>', ' ', text)
-            text = re.sub(r'\s+', ' ', text).strip()
-            # Truncate
-            if len(text) > 4000:
-                text = text[:4000] + " [... truncated ...]"
-            return text if len(text) > 100 else None
-    except Exception:
-        pass
-    return None
+class _TextExtractor(HTMLParser):
+    """Single-pass visible-text extraction; skips script/style content."""
 
+    _SKIP = {"script", "style"}
 
-def create_summary_prompt(content: PluginContent) -> str:
-    """Create a prompt for generating a plugin summary."""
-    prompt = f"""Analyze this Sketch plugin and write a concise research summary.
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._chunks = []
+        self._skip_depth = 0
 
-## Plugin Information
+    def handle_starttag(self, tag, attrs):
+        if tag in self._SKIP:
+            self._skip_depth += 1
 
-**Name**: {content.name}
-**Link**: {content.link}
-**Description**: {content.description}
+    def handle_endtag(self, tag):
+        if tag in self._SKIP and self._skip_depth:
+            self._skip_depth -= 1
 
-"""
-    if content.readme:
-        prompt += f"""## README Content
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self._chunks.append(data)
 
-{content.readme}
+    def text(self) -> str:
+        return re.sub(r"\s+", " ", " ".join(self._chunks)).strip()
 
-"""
-    elif content.homepage:
-        prompt += f"""## Homepage Content
 
-{content.homepage}
+def extract_text_from_html(html: str) -> str:
+    """Extract visible text from an HTML document."""
+    if _SelectolaxParser is not None:
+        # Proper C-level DOM parse; handles malformed HTML the best
+        tree = _SelectolaxParser(html)
+        for node in tree.css("script, style"):
+            node.decompose()
+        root = tree.body or tree.root
+        text = root.text(separator=" ") if root else ""
+        return re.sub(r"\s+", " ", text).strip()
 
-"""
+    # Fallback: one stdlib parser pass instead of three regex rewrites of
+    # the whole document; also decodes entities the regexes left behind
+    extractor = _TextExtractor()
+    extractor.feed(html)
+    extractor.close()
+    return extractor.text()
+
+
+def _extract_homepage_text(url: str, html: str, etag: Optional[str] = None) -> Optional[str]:
+    """Extract, truncate, and cache homepage text from fetched HTML."""
+    text = extract_text_from_html(html)
+    if len(text) > 4000:
+        text = text[:4000] + " [... truncated ...]"
+    if len(text) > 100:
+        if etag:
+            cache_put("homepage", url, text, etag=etag)
+        else:
+            cache_put("homepage", url, text)
+        return text
+    return None
 
-    prompt += """## Task
+
+def fetch_webpage_content(url: str) -> Optional[str]:
+    """Fetch and extract text from a webpage."""
+    cached = cache_get("homepage", url)
+    if cached is not None and cache_is_fresh(cached):
+        return cached["content"]
+
+    # In-process fetch when httpx/requests is installed: no fork+exec per
+    # page, and connection pooling across fetches on the same host
+    if _http is not None:
+        try:
+            # Redirect-following is configured on the shared client
+            # (requests follows by default, httpx via follow_redirects)
+            kwargs = {"timeout": 10}
+            if cached is not None and cached.get("etag"):
+                kwargs["headers"] = {"If-None-Match": cached["etag"]}
+            resp = get_http_client().get(url, **kwargs)
+            if resp.status_code == 304:
+                cache_put("homepage", url, cached["content"], etag=cached.get("etag"))
+                return cached["content"]
+            if resp.status_code == 200 and resp.text:
+                etag = resp.headers.get("ETag")
+                return _extract_homepage_text(url, resp.text, etag=etag)
+        except Exception:
+            pass
+        return cached["content"] if cached is not None else None
+
+    # Fallback: curl subprocess (skipped outright when curl is absent)
+    if CURL_AVAILABLE:
+        try:
+            result = subprocess.run(
+                ["curl", "-sL", "-m", "10", url],
+                capture_output=True, text=True, timeout=15
+            )
+            if result.returncode == 0 and result.stdout:
+                return _extract_homepage_text(url, result.stdout)
+        except Exception:
+            pass
+    return cached["content"] if cached is not None else None
+
+
+# Instruction block shared verbatim by every request, built once at import
+# time. It leads the prompt so the API's prompt cache can serve it as a
+# stable prefix; only the per-plugin block below it varies.
+PROMPT_INSTRUCTIONS = """Analyze the Sketch plugin described below and write a concise research summary.
+
+## Task
 
 Write a 2-4 sentence summary that covers:
 1. What the plugin does (main functionality)
@@ -148,22 +414,59 @@ Write a 2-4 sentence summary that covers:
 Keep it factual and concise. Do not include marketing language.
 Output ONLY the summary text, no headers or formatting."""
 
-    return prompt
 
+def create_summary_prompt(content: PluginContent) -> list[dict]:
+    """Build the content blocks for one summary request.
 
-def generate_summary_with_api(prompt: str, api_key: str) -> Optional[str]:
-    """Generate summary using Anthropic API."""
+    The shared instruction block carries a cache_control breakpoint so
+    repeated requests hit the server-side prompt cache instead of
+    re-processing the same prefix at full input-token cost.
+    """
+    parts = [f"""## Plugin Information
+
+**Name**: {content.name}
+**Link**: {content.link}
+**Description**: {content.description}
+
+"""]
+
+    if content.readme:
+        parts.append(f"## README Content\n\n{content.readme}\n")
+    elif content.homepage:
+        parts.append(f"## Homepage Content\n\n{content.homepage}\n")
+
+    return [
+        {"type": "text", "text": PROMPT_INSTRUCTIONS,
+         "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": "".join(parts)},
+    ]
+
+
+@lru_cache(maxsize=1)
+def get_anthropic_client(api_key: str):
+    """Shared Anthropic client (one TLS connection for every request).
+
+    Constructing a client per call re-established a TCP+TLS session to
+    the API for each summary. Returns None when the SDK is missing.
+    """
     try:
         import anthropic
     except ImportError:
         print("Error: anthropic package not installed. Run: pip install anthropic", file=sys.stderr)
         return None
+    return anthropic.Anthropic(api_key=api_key)
+
+
+def generate_summary_with_api(prompt: list[dict], api_key: str) -> Optional[str]:
+    """Generate summary using Anthropic API."""
+    client = get_anthropic_client(api_key)
+    if client is None:
+        return None
 
     try:
-        client = anthropic.Anthropic(api_key=api_key)
         message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=500,
+            model=ANTHROPIC_MODEL,
+            max_tokens=SUMMARY_MAX_TOKENS,
             messages=[{"role": "user", "content": prompt}]
         )
         return message.content[0].text.strip()
@@ -172,6 +475,60 @@ def generate_summary_with_api(prompt: str, api_key: str) -> Optional[str]:
         return None
 
 
+def generate_summaries_with_batch_api(prompts: list[list[dict]], api_key: str) -> list[Optional[str]]:
+    """
+    Generate summaries for many prompts via the Message Batches API.
+
+    One batch submission replaces N sequential API round trips (and the
+    per-call LLM_DELAY), at ~50% of the per-token cost. Returns summaries
+    in prompt order, with None for failed requests.
+    """
+    client = get_anthropic_client(api_key)
+    if client is None:
+        return [None] * len(prompts)
+
+    results: list[Optional[str]] = [None] * len(prompts)
+    if not prompts:
+        return results
+
+    try:
+        # Submit in chunks to stay well under the batch request/size caps;
+        # a failed chunk then only loses its own requests
+        for start in range(0, len(prompts), BATCH_CHUNK_SIZE):
+            chunk = prompts[start:start + BATCH_CHUNK_SIZE]
+            batch = client.messages.batches.create(
+                requests=[{
+                    "custom_id": f"summary-{start + i}",
+                    "params": {
+                        "model": ANTHROPIC_MODEL,
+                        "max_tokens": SUMMARY_MAX_TOKENS,
+                        "messages": [{"role": "user", "content": prompt}],
+                    },
+                } for i, prompt in enumerate(chunk)]
+            )
+
+            print(f"  Submitted batch {batch.id} ({len(chunk)} requests)", file=sys.stderr)
+
+            # Poll with exponential backoff; large batches take minutes,
+            # so hammering the status endpoint buys nothing
+            poll = BATCH_POLL_INTERVAL
+            while batch.processing_status == "in_progress":
+                time.sleep(poll)
+                poll = min(poll * 2, BATCH_POLL_MAX)
+                batch = client.messages.batches.retrieve(batch.id)
+
+            for entry in client.messages.batches.results(batch.id):
+                index = int(entry.custom_id.rsplit("-", 1)[1])
+                if entry.result.type == "succeeded":
+                    results[index] = entry.result.message.content[0].text.strip()
+                else:
+                    print(f"  Batch request {entry.custom_id}: {entry.result.type}", file=sys.stderr)
+    except Exception as e:
+        print(f"  Batch LLM error: {e}", file=sys.stderr)
+
+    return results
+
+
 def load_plugins_by_category(plugins_dir: Path, category: str) -> list[tuple[Path, list]]:
     """Load plugins from a specific category file."""
     filename = category.lower().replace(" ", "-").replace("/", "-") + ".yml"
@@ -185,35 +542,159 @@ def load_plugins_by_category(plugins_dir: Path, category: str) -> list[tuple[Pat
             return []
 
     with open(filepath, "r", encoding="utf-8") as f:
-        entries = yaml.safe_load(f) or []
+        entries = yaml.load(f, Loader=YamlLoader) or []
 
     return [(filepath, entries)]
 
 
-def load_all_plugins(plugins_dir: Path) -> list[tuple[Path, list]]:
-    """Load all plugins from all category files."""
-    result = []
-    for filepath in sorted(plugins_dir.glob("*.yml")):
-        with open(filepath, "r", encoding="utf-8") as f:
-            entries = yaml.safe_load(f) or []
-        if entries:
-            result.append((filepath, entries))
-    return result
+def _load_yaml_file(filepath: Path) -> tuple[Path, list]:
+    """Load a single category file."""
+    with open(filepath, "r", encoding="utf-8") as f:
+        return filepath, yaml.load(f, Loader=YamlLoader) or []
 
 
-def find_plugin_by_name(plugins_dir: Path, name: str) -> Optional[tuple[Path, list, int]]:
-    """Find a plugin by name across all files."""
-    for filepath in plugins_dir.glob("*.yml"):
+# Sidecar recording how many entries in each category file still lack a
+# summary, keyed by mtime; lets --missing runs skip saturated files without
+# parsing them. Stale or absent records simply fall back to a full parse.
+STATUS_INDEX_NAME = ".status_index.json"
+
+
+def _load_status_index(plugins_dir: Path) -> dict:
+    """Load the per-file status index (empty on any problem)."""
+    try:
+        with open(plugins_dir / STATUS_INDEX_NAME, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _record_file_status(plugins_dir: Path, parsed: list[tuple[Path, list]]):
+    """Refresh the status index for the given parsed files."""
+    index = _load_status_index(plugins_dir)
+    for filepath, entries in parsed:
+        try:
+            mtime = os.path.getmtime(filepath)
+        except OSError:
+            continue
+        index[filepath.name] = {
+            "missing_count": sum(1 for e in entries if not e.get("summary")),
+            "mtime": mtime,
+        }
+    with open(plugins_dir / STATUS_INDEX_NAME, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+
+
+def load_all_plugins(plugins_dir: Path, missing_only: bool = False) -> list[tuple[Path, list]]:
+    """Load all plugins from all category files (parsed in parallel).
+
+    With missing_only, files the status index shows as fully summarized
+    (and unmodified since) are skipped without being opened.
+    """
+    filepaths = sorted(plugins_dir.glob("*.yml"))
+
+    if missing_only:
+        index = _load_status_index(plugins_dir)
+        fresh = []
+        for filepath in filepaths:
+            record = index.get(filepath.name)
+            if (record and record.get("missing_count") == 0
+                    and record.get("mtime") == os.path.getmtime(filepath)):
+                continue
+            fresh.append(filepath)
+        filepaths = fresh
+
+    if not filepaths:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(filepaths))) as pool:
+        loaded = list(pool.map(_load_yaml_file, filepaths))
+
+    if missing_only:
+        _record_file_status(plugins_dir, loaded)
+
+    return [(filepath, entries) for filepath, entries in loaded if entries]
+
+
+@lru_cache(maxsize=1)
+def _build_name_index(plugins_dir_str: str) -> dict[str, tuple[Path, int]]:
+    """Map lowercased plugin name -> (filepath, index), parsed once."""
+    index = {}
+    for filepath in sorted(Path(plugins_dir_str).glob("*.yml")):
         with open(filepath, "r", encoding="utf-8") as f:
-            entries = yaml.safe_load(f) or []
+            entries = yaml.load(f, Loader=YamlLoader) or []
         for i, entry in enumerate(entries):
-            if entry.get("plugin", "").lower() == name.lower():
-                return (filepath, entries, i)
+            # First occurrence wins, matching the old scan order
+            index.setdefault(entry.get("plugin", "").lower(), (filepath, i))
+    return index
+
+
+def find_plugin_by_name(plugins_dir: Path, name: str) -> Optional[tuple[Path, list, int]]:
+    """Find a plugin by name (one dict lookup after the first call)."""
+    located = _build_name_index(str(plugins_dir)).get(name.lower())
+    if located is None:
+        return None
+    filepath, i = located
+    with open(filepath, "r", encoding="utf-8") as f:
+        entries = yaml.load(f, Loader=YamlLoader) or []
+    return (filepath, entries, i)
+
+
+# GitHub Pages project URLs carry the backing repo in the hostname/path
+GITHUB_PAGES_PATTERN = re.compile(
+    r"https?://([\w-]+)\.github\.io/([^/?#]+)", re.IGNORECASE
+)
+
+
+def infer_github_url(link: str) -> Optional[str]:
+    """Infer the backing GitHub repo URL for a GitHub Pages project site."""
+    match = GITHUB_PAGES_PATTERN.match(link)
+    if match:
+        return f"https://github.com/{match.group(1)}/{match.group(2)}"
     return None
 
 
-def fetch_plugin_content(entry: dict, filepath: Path, index: int, verbose: bool = True) -> PluginContent:
-    """Fetch content for a single plugin."""
+def _race_fetches(github_url: str, link: str, verbose: bool):
+    """Fetch README and homepage concurrently; first usable response wins.
+
+    For links with both a rendered page and a backing repo, whichever
+    source answers first with substantial content (>100 chars) is kept,
+    halving tail latency when one of the two is slow. Returns a
+    (readme, homepage) pair with at most the losing slot left as None.
+    """
+    def _readme():
+        GITHUB_LIMITER.acquire()
+        return fetch_github_readme(github_url, verbose=verbose)
+
+    executor = ThreadPoolExecutor(max_workers=2)
+    try:
+        future_readme = executor.submit(_readme)
+        future_homepage = executor.submit(fetch_webpage_content, link)
+        done, _ = wait(
+            {future_readme, future_homepage}, return_when=FIRST_COMPLETED
+        )
+        winner = done.pop()
+        result = winner.result()
+        if result and len(result) > 100:
+            if winner is future_readme:
+                return result, None
+            return None, result
+        # Winner came back empty or thin; wait for the other source too
+        return future_readme.result() or None, future_homepage.result() or None
+    finally:
+        executor.shutdown(wait=False)
+
+
+def fetch_plugin_content(
+    entry: dict, filepath: Path, index: int,
+    verbose: bool = True, skip_existing: bool = True
+) -> PluginContent:
+    """Fetch content for a single plugin.
+
+    With skip_existing, entries that already carry a summary skip the
+    network entirely. Callers must only enable it when those entries are
+    not being re-summarized, otherwise the LLM would regenerate their
+    summaries from name+description alone.
+    """
     name = entry.get("plugin", "Unknown")
     link = entry.get("link", "")
     description = entry.get("description", "")
@@ -229,11 +710,16 @@ def fetch_plugin_content(entry: dict, filepath: Path, index: int, verbose: bool
         is_github=is_github
     )
 
+    if skip_existing and entry.get("summary"):
+        if verbose:
+            print(f"  Skipping fetch (already summarized): {name}", file=sys.stderr)
+        return content
+
     if verbose:
         print(f"  Fetching: {name}", file=sys.stderr)
 
     if is_github:
-        time.sleep(GITHUB_DELAY)
+        GITHUB_LIMITER.acquire()
         content.readme = fetch_github_readme(link, verbose=verbose)
         if verbose:
             if content.readme:
@@ -241,9 +727,18 @@ def fetch_plugin_content(entry: dict, filepath: Path, index: int, verbose: bool
             else:
                 print(f"    README: not found", file=sys.stderr)
     else:
-        content.homepage = fetch_webpage_content(link)
+        github_url = infer_github_url(link)
+        if github_url is not None:
+            # The page has a backing repo: race both sources
+            content.readme, content.homepage = _race_fetches(
+                github_url, link, verbose
+            )
+        else:
+            content.homepage = fetch_webpage_content(link)
         if verbose:
-            if content.homepage:
+            if content.readme:
+                print(f"    README: {len(content.readme)} chars", file=sys.stderr)
+            elif content.homepage:
                 print(f"    Homepage: {len(content.homepage)} chars", file=sys.stderr)
             else:
                 print(f"    Homepage: not found", file=sys.stderr)
@@ -251,14 +746,107 @@ def fetch_plugin_content(entry: dict, filepath: Path, index: int, verbose: bool
     return content
 
 
-def update_yaml_file(filepath: Path, entries: list):
-    """Write updated entries back to YAML file."""
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write("---\n")
-        yaml.dump(entries, f, default_flow_style=False,
+def select_entries(files_to_process: list, args) -> list[tuple[Path, dict, int]]:
+    """Select (filepath, entry, index) tuples honoring filters and limit."""
+    selected = []
+    for filepath, entries in files_to_process:
+        for i, entry in enumerate(entries):
+            if len(selected) >= args.limit:
+                return selected
+
+            if args.missing and entry.get("summary"):
+                continue
+
+            if args.plugin and entry.get("plugin", "").lower() != args.plugin.lower():
+                continue
+
+            selected.append((filepath, entry, i))
+    return selected
+
+
+def fetch_plugin_contents(
+    selected: list[tuple[Path, dict, int]],
+    verbose: bool = True, skip_existing: bool = True
+) -> list[PluginContent]:
+    """Fetch content for multiple plugins concurrently, preserving order."""
+    if not selected:
+        return []
+
+    workers = min(FETCH_WORKERS, len(selected))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(
+            lambda item: fetch_plugin_content(
+                item[1], item[0], item[2],
+                verbose=verbose, skip_existing=skip_existing),
+            selected
+        ))
+
+
+def update_yaml_file(filepath: Path, entries: list) -> bool:
+    """
+    Write updated entries back to YAML file.
+
+    Serializes first and compares against what is on disk, so untouched
+    files keep their mtime (and git stays quiet). Returns True if written.
+    """
+    content = "---\n" + yaml.dump(entries, default_flow_style=False,
+                                  allow_unicode=True, sort_keys=False)
+    try:
+        if filepath.read_text(encoding="utf-8") == content:
+            return False
+    except OSError:
+        pass
+
+    filepath.write_text(content, encoding="utf-8")
+    # Keep the --missing skip index in step with what just landed on disk
+    _record_file_status(filepath.parent, [(filepath, entries)])
+    return True
+
+
+# Crash-safe journal for API-mode runs: each summary is appended here the
+# moment it is generated, so an interrupted run loses nothing even though
+# the category files themselves are only rewritten once per file.
+JOURNAL_NAME = ".summary_journal.yml"
+
+
+def journal_append(plugins_dir: Path, filepath: Path, index: int, summary: str):
+    """Append one summary record (concatenated list dumps stay valid YAML)."""
+    record = [{"file": filepath.name, "index": index, "summary": summary}]
+    with open(plugins_dir / JOURNAL_NAME, "a", encoding="utf-8") as f:
+        yaml.dump(record, f, default_flow_style=False,
                   allow_unicode=True, sort_keys=False)
 
 
+def apply_journal(plugins_dir: Path) -> int:
+    """Merge a journal left behind by a crashed run into the category files."""
+    journal_path = plugins_dir / JOURNAL_NAME
+    if not journal_path.exists():
+        return 0
+
+    with open(journal_path, "r", encoding="utf-8") as f:
+        records = yaml.load(f, Loader=YamlLoader) or []
+
+    by_file = {}
+    for record in records:
+        by_file.setdefault(record["file"], []).append(record)
+
+    applied = 0
+    for filename, file_records in by_file.items():
+        filepath = plugins_dir / filename
+        if not filepath.exists():
+            continue
+        _, entries = _load_yaml_file(filepath)
+        for record in file_records:
+            index = record["index"]
+            if 0 <= index < len(entries) and not entries[index].get("summary"):
+                entries[index]["summary"] = record["summary"]
+                applied += 1
+        update_yaml_file(filepath, entries)
+
+    journal_path.unlink()
+    return applied
+
+
 def run_interactive_mode(plugins_dir: Path, files_to_process: list, args) -> int:
     """
     Interactive mode: fetch content and output structured JSON for AI tools.
@@ -283,35 +871,17 @@ def run_interactive_mode(plugins_dir: Path, files_to_process: list, args) -> int
         "instructions": "Generate summaries for each plugin..."
     }
     """
-    plugins_data = []
-    processed = 0
+    selected = select_entries(files_to_process, args)
 
-    print(f"Fetching content for up to {args.limit} plugins...", file=sys.stderr)
+    print(f"Fetching content for {len(selected)} plugins "
+          f"({FETCH_WORKERS} workers)...", file=sys.stderr)
     print(file=sys.stderr)
 
-    for filepath, entries in files_to_process:
-        if processed >= args.limit:
-            break
-
-        print(f"{filepath.name}:", file=sys.stderr)
-
-        for i, entry in enumerate(entries):
-            if processed >= args.limit:
-                break
-
-            # Skip if already has summary (unless processing specific plugin)
-            if args.missing and entry.get("summary"):
-                continue
-
-            # Skip if processing specific plugin and this isn't it
-            if args.plugin and entry.get("plugin", "").lower() != args.plugin.lower():
-                continue
-
-            content = fetch_plugin_content(entry, filepath, i, verbose=True)
-            plugins_data.append(content.to_dict())
-            processed += 1
-
-        print(file=sys.stderr)
+    # Every selected entry gets re-summarized, so its content must be
+    # fetched; the skip is only safe under --missing, where selection
+    # already excludes summarized entries
+    contents = fetch_plugin_contents(selected, skip_existing=args.missing)
+    plugins_data = [content.to_dict() for content in contents]
 
     # Output structured JSON to stdout
     output = {
@@ -338,57 +908,96 @@ The 'filepath' and 'index' fields indicate where to update."""
 
 
 def run_api_mode(plugins_dir: Path, files_to_process: list, args) -> int:
-    """API mode: batch process with Anthropic API."""
-    processed = 0
-    updated = 0
+    """API mode: prefetch content concurrently, then summarize serially."""
+    selected = select_entries(files_to_process, args)
 
-    print(f"Processing up to {args.limit} plugins with API...", file=sys.stderr)
+    print(f"Processing {len(selected)} plugins with API...", file=sys.stderr)
     print(file=sys.stderr)
 
-    for filepath, entries in files_to_process:
-        if processed >= args.limit:
-            break
-
-        print(f"{filepath.name}:", file=sys.stderr)
-        modified = False
+    # Content fetches are independent, so overlap them up front; only the
+    # rate-limited LLM calls stay serial. Every selected entry gets
+    # re-summarized, so the fetch skip is only safe under --missing,
+    # where selection already excludes summarized entries
+    contents = fetch_plugin_contents(selected, skip_existing=args.missing)
 
-        for i, entry in enumerate(entries):
-            if processed >= args.limit:
-                break
+    updated = 0
+    entries_by_file = dict(files_to_process)
+    current_file = None
+    file_modified = False
+
+    for (filepath, entry, index), content in zip(selected, contents):
+        # selected is grouped by file; save each file as we leave it so a
+        # crash mid-run keeps earlier summaries
+        if current_file is not None and filepath != current_file:
+            if file_modified and update_yaml_file(current_file, entries_by_file[current_file]):
+                print(f"  Saved {current_file.name}", file=sys.stderr)
+            file_modified = False
+        current_file = filepath
+
+        prompt = create_summary_prompt(content)
+        # The prompt now holds the only copy of the text we need; free the
+        # raw fetch so the working set stays O(one prompt) during the run
+        content.release_content()
+
+        LLM_LIMITER.acquire()
+        summary = generate_summary_with_api(prompt, args.api_key)
+
+        if summary:
+            entry["summary"] = summary
+            # Journal immediately: a crash between here and the per-file
+            # save loses nothing, and the next run merges the journal
+            journal_append(plugins_dir, filepath, index, summary)
+            file_modified = True
+            updated += 1
+            print(f"    {content.name}: {len(summary)} chars", file=sys.stderr)
+        else:
+            print(f"    {content.name}: FAILED", file=sys.stderr)
 
-            if args.missing and entry.get("summary"):
-                continue
+    if current_file is not None and file_modified:
+        if update_yaml_file(current_file, entries_by_file[current_file]):
+            print(f"  Saved {current_file.name}", file=sys.stderr)
 
-            if args.plugin and entry.get("plugin", "").lower() != args.plugin.lower():
-                continue
+    # Everything journaled made it into the category files
+    journal_path = plugins_dir / JOURNAL_NAME
+    if journal_path.exists():
+        journal_path.unlink()
 
-            # Fetch content
-            content = fetch_plugin_content(entry, filepath, i, verbose=True)
+    print("=" * 50, file=sys.stderr)
+    print(f"Processed: {len(selected)}", file=sys.stderr)
+    print(f"Updated:   {updated}", file=sys.stderr)
 
-            # Generate prompt and call API
-            prompt = create_summary_prompt(content)
+    return 0
 
-            time.sleep(LLM_DELAY)
-            summary = generate_summary_with_api(prompt, args.api_key)
 
-            if summary:
-                entry["summary"] = summary
-                modified = True
-                updated += 1
-                print(f"    Summary: {len(summary)} chars", file=sys.stderr)
-            else:
-                print(f"    Summary: FAILED", file=sys.stderr)
+def run_batch_api_mode(plugins_dir: Path, files_to_process: list, args) -> int:
+    """Batch API mode: fetch all content, then one Message Batches submission."""
+    selected = select_entries(files_to_process, args)
 
-            processed += 1
+    print(f"Fetching content for {len(selected)} plugins...", file=sys.stderr)
+    # Same rule as run_api_mode: fetch whatever will be re-summarized
+    contents = fetch_plugin_contents(selected, skip_existing=args.missing)
 
-        if modified:
-            update_yaml_file(filepath, entries)
-            print(f"  Saved {filepath.name}", file=sys.stderr)
+    prompts = []
+    for content in contents:
+        prompts.append(create_summary_prompt(content))
+        content.release_content()
+    summaries = generate_summaries_with_batch_api(prompts, args.api_key)
 
-        print(file=sys.stderr)
+    updated = 0
+    modified_files = set()
+    for (filepath, entry, _index), summary in zip(selected, summaries):
+        if summary:
+            entry["summary"] = summary
+            modified_files.add(filepath)
+            updated += 1
+
+    entries_by_file = dict(files_to_process)
+    for filepath in sorted(modified_files):
+        update_yaml_file(filepath, entries_by_file[filepath])
+        print(f"  Saved {filepath.name}", file=sys.stderr)
 
     print("=" * 50, file=sys.stderr)
-    print(f"Processed: {processed}", file=sys.stderr)
+    print(f"Processed: {len(selected)}", file=sys.stderr)
     print(f"Updated:   {updated}", file=sys.stderr)
 
     return 0
@@ -441,6 +1050,8 @@ def main():
     )
     parser.add_argument("--api-key",
                         help="Anthropic API key for batch processing. If not set, outputs JSON for AI tools.")
+    parser.add_argument("--batch", action="store_true",
+                        help="With --api-key: use the Message Batches API (one submission, ~50%% cost)")
     parser.add_argument("--category", help="Process plugins in this category")
     parser.add_argument("--plugin", help="Process specific plugin by name")
     parser.add_argument("--missing", action="store_true",
@@ -449,8 +1060,14 @@ def main():
                         help="Maximum number of plugins to process (default: 5)")
     parser.add_argument("--dry-run", action="store_true",
                         help="Show what would be processed without fetching or generating")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the on-disk fetch cache")
     args = parser.parse_args()
 
+    if args.no_cache:
+        global _cache_enabled
+        _cache_enabled = False
+
     # Find plugins directory
     skill_root = Path(__file__).parent.parent.parent
     plugins_dir = skill_root / "references" / "plugins"
@@ -459,6 +1076,12 @@ def main():
         print(f"Error: Plugins directory not found: {plugins_dir}", file=sys.stderr)
         return 1
 
+    # Recover summaries journaled by a previous run that crashed mid-save
+    recovered = apply_journal(plugins_dir)
+    if recovered:
+        print(f"Recovered {recovered} journaled summaries from a previous run",
+              file=sys.stderr)
+
     # Load plugins based on options
     files_to_process = []
 
@@ -479,7 +1102,7 @@ def main():
             print(f"Category not found: {args.category}", file=sys.stderr)
             return 1
     else:
-        files_to_process = load_all_plugins(plugins_dir)
+        files_to_process = load_all_plugins(plugins_dir, missing_only=args.missing)
         total = sum(len(entries) for _, entries in files_to_process)
         print(f"All categories: {total} plugins in {len(files_to_process)} files", file=sys.stderr)
 
@@ -488,6 +1111,8 @@ def main():
     # Run appropriate mode
     if args.dry_run:
         return run_dry_run(plugins_dir, files_to_process, args)
+    elif args.api_key and args.batch:
+        return run_batch_api_mode(plugins_dir, files_to_process, args)
     elif args.api_key:
         return run_api_mode(plugins_dir, files_to_process, args)
     else:
@@ -72,15 +72,15 @@ def cmd_list_category(category: str):
 
 def cmd_search(query: str):
     """Search plugins by name or description."""
+    import re
     from lib import PluginState
 
     state = PluginState()
-    query_lower = query.lower()
 
-    matches = [
-        p for p in state.plugins.values()
-        if query_lower in p.name.lower() or query_lower in p.description.lower()
-    ]
+    # One C-level scan over the precomputed searchable text per record,
+    # instead of lowercasing name and description for every plugin
+    pattern = re.compile(re.escape(query), re.IGNORECASE)
+    matches = [p for p in state.plugins.values() if pattern.search(p.searchable)]
 
     print(f'Found {len(matches)} plugins matching "{query}":')
     for p in sorted(matches, key=lambda x: x.name.lower())[:20]:
@@ -4,8 +4,20 @@ Plugin Categorizer
 Keyword-based categorization for Sketch plugins.
 """
 
+import re
+from functools import lru_cache
 from typing import Optional
 
+try:
+    import ahocorasick  # pip install pyahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import hyperscan  # pip install hyperscan (SIMD-accelerated literal sets)
+except ImportError:
+    hyperscan = None
+
 
 # Category definitions with priority-ordered keyword patterns
 # More specific patterns come first to avoid mis-categorization
@@ -163,6 +175,9 @@ CATEGORIES = {
     "Human-Focused": ["anniversary", "fun", "joke", "game"],
 }
 
+# Used for the Exports vs Imports conflict check
+_IMPORT_PATTERN = re.compile("import", re.IGNORECASE)
+
 
 def to_filename(category: str) -> str:
     """Convert category name to valid filename (without extension)."""
@@ -202,6 +217,92 @@ class PluginCategorizer:
         """
         self.categories = categories or CATEGORIES
 
+        # One compiled alternation per category, in priority order. Each
+        # categorize() call then does one C-level scan per category instead
+        # of a Python-level substring test per keyword.
+        self._compiled = [
+            (category,
+             re.compile("|".join(re.escape(k) for k in keywords), re.IGNORECASE))
+            for category, keywords in self.categories.items()
+        ]
+
+        # Alternate scan order with Imports moved directly before Exports.
+        # Used when the text contains "import": Imports then wins the
+        # Exports/Imports conflict by position, so the scan loop needs no
+        # per-match conflict branch at all.
+        self._conflict_order = list(self._compiled)
+        categories_in_order = [category for category, _ in self._conflict_order]
+        if "Exports" in categories_in_order and "Imports" in categories_in_order:
+            imports_entry = self._conflict_order.pop(
+                categories_in_order.index("Imports"))
+            self._conflict_order.insert(
+                categories_in_order.index("Exports"), imports_entry)
+
+        # Aho-Corasick automaton over all keywords: one O(len(text)) pass
+        # regardless of category count. Optional; regex scan is the fallback.
+        self._priority = {category: i for i, category in enumerate(self.categories)}
+        self._automaton = self._build_automaton() if ahocorasick is not None else None
+
+        # Hyperscan database for bulk_categorize, compiled on first use
+        self._hs_db = None
+
+        # Memoize per instance: re-categorization sweeps hit the same
+        # (name, description) text repeatedly, so repeats cost a dict lookup.
+        # Wrapping here (not decorating the method) keeps the cache bound to
+        # this instance rather than pinning instances in a class-level cache.
+        self._categorize_text = lru_cache(maxsize=4096)(self._categorize_text)
+
+    def _build_automaton(self):
+        """Build an automaton mapping each keyword to (priority, category)."""
+        automaton = ahocorasick.Automaton()
+        for category, keywords in self.categories.items():
+            priority = self._priority[category]
+            for keyword in keywords:
+                keyword = keyword.lower()
+                # Keep the highest-priority category for duplicate keywords
+                if not automaton.exists(keyword) or priority < automaton.get(keyword)[0]:
+                    automaton.add_word(keyword, (priority, category))
+        automaton.make_automaton()
+        return automaton
+
+    def _categorize_with_automaton(self, text: str) -> str:
+        """Pick the highest-priority matching category in one scan."""
+        best = None
+        best_non_exports = None
+
+        for _, (priority, category) in self._automaton.iter(text.lower()):
+            if best is None or priority < best[0]:
+                best = (priority, category)
+            if category != "Exports" and (
+                best_non_exports is None or priority < best_non_exports[0]
+            ):
+                best_non_exports = (priority, category)
+
+        if best is None:
+            return "Other"
+
+        # Special handling for Exports vs Imports conflict
+        if best[1] == "Exports" and _IMPORT_PATTERN.search(text):
+            return best_non_exports[1] if best_non_exports else "Other"
+
+        return best[1]
+
+    def _categorize_text(self, text: str) -> str:
+        """Categorize combined name+description text (memoized in __init__)."""
+        if self._automaton is not None:
+            return self._categorize_with_automaton(text)
+
+        # Patterns are IGNORECASE-compiled, so no lowercased copy is needed.
+        # One up-front "import" probe picks the scan order that already
+        # encodes the Exports vs Imports conflict rule.
+        compiled = (self._conflict_order if _IMPORT_PATTERN.search(text)
+                    else self._compiled)
+        for category, pattern in compiled:
+            if pattern.search(text):
+                return category
+
+        return "Other"
+
     def categorize(self, name: str, description: str) -> str:
         """
         Categorize a plugin based on its name and description.
@@ -213,17 +314,67 @@ class PluginCategorizer:
         Returns:
             Category name string
         """
-        text = f"{name} {description}".lower()
-
-        for category, keywords in self.categories.items():
-            for keyword in keywords:
-                if keyword.lower() in text:
-                    # Special handling for Exports vs Imports conflict
-                    if category == "Exports" and "import" in text:
-                        continue
-                    return category
+        return self._categorize_text(name + " " + description)
+
+    def _hyperscan_db(self):
+        """Compile all keywords into one Hyperscan database (lazily)."""
+        if self._hs_db is None:
+            expressions, ids, flags = [], [], []
+            for category, keywords in self.categories.items():
+                priority = self._priority[category]
+                for keyword in keywords:
+                    expressions.append(re.escape(keyword).encode())
+                    ids.append(priority)
+                    flags.append(
+                        hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+                    )
+            db = hyperscan.Database()
+            db.compile(expressions=expressions, ids=ids, flags=flags)
+            self._hs_db = db
+        return self._hs_db
+
+    def _bulk_with_hyperscan(self, plugins: list[tuple[str, str]]) -> list[str]:
+        """Categorize via one SIMD scan per text; same semantics as categorize."""
+        db = self._hyperscan_db()
+        names = list(self.categories)
+        exports_id = self._priority.get("Exports")
+        imports_id = self._priority.get("Imports")
+
+        matched = set()
+
+        def on_match(match_id, start, end, match_flags, context=None):
+            matched.add(match_id)
+
+        results = []
+        for name, description in plugins:
+            matched.clear()
+            text = (name + " " + description).encode(errors="replace")
+            db.scan(text, match_event_handler=on_match)
+
+            if not matched:
+                results.append("Other")
+                continue
+
+            best = min(matched)
+            # Exports vs Imports conflict: an Imports match means the text
+            # contains "import", so defer to the next non-Exports category
+            if best == exports_id and imports_id in matched:
+                best = min(i for i in matched if i != exports_id)
+            results.append(names[best])
+
+        return results
+
+    def bulk_categorize(self, plugins: list[tuple[str, str]]) -> list[str]:
+        """
+        Categorize many (name, description) pairs at once.
 
-        return "Other"
+        Uses Hyperscan's SIMD-compiled literal set when installed; otherwise
+        falls back to the per-call path (automaton or compiled regexes),
+        which still benefits from the memoized cache.
+        """
+        if hyperscan is not None:
+            return self._bulk_with_hyperscan(plugins)
+        return [self.categorize(name, description) for name, description in plugins]
 
     def get_all_categories(self) -> list[str]:
         """Get list of all category names including 'Other'."""
@@ -7,6 +7,7 @@ Compares against YAML files in references/plugins/ as the source of truth.
 
 import re
 import json
+import shutil
 import subprocess
 from dataclasses import dataclass
 from enum import Enum
@@ -16,6 +17,10 @@ from .state import PluginState, PluginRecord
 from .schema import WatchStatus
 from .scraper import ScrapedPlugin, PluginScraper
 
+# Resolved once at import so diff-stat lookups don't repeat the PATH
+# walk (or fork a doomed subprocess) when curl is missing
+_CURL_AVAILABLE = shutil.which("curl") is not None
+
 
 class ChangeType(str, Enum):
     """Type of change detected."""
@@ -102,11 +107,15 @@ class PluginDiffer:
         results = []
         scraped_keys = set()
 
+        # state.plugins is already keyed by normalized link, so each
+        # scraped plugin resolves with one dict lookup; normalize once
+        # here instead of again inside get_plugin
+        plugins_by_key = self.state.plugins
         for plugin in scraped:
-            key = plugin.link.lower().rstrip("/")
+            key = PluginState._norm(plugin.link)
             scraped_keys.add(key)
 
-            existing = self.state.get_plugin(plugin.link)
+            existing = plugins_by_key.get(key)
             result = self._diff_one(plugin, existing)
             results.append(result)
 
@@ -166,9 +175,10 @@ class PluginDiffer:
 
     def _compute_existing_hash(self, record: PluginRecord) -> str:
         """Compute content hash for existing record."""
-        import hashlib
+        # Must match ScrapedPlugin.content_hash, whichever backend it uses
+        from .scraper import _fast_hash
         content = f"{record.name}|{record.description}|{record.author}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        return _fast_hash(content.encode())[:16]
 
     def _diff_github(self, plugin: ScrapedPlugin, existing: PluginRecord) -> DiffResult:
         """Diff a GitHub plugin using commit comparison."""
@@ -266,6 +276,9 @@ class PluginDiffer:
         # Get compare info from GitHub API
         api_url = f"https://api.github.com/repos/{owner}/{repo}/compare/{from_sha}...{to_sha}"
 
+        if not _CURL_AVAILABLE:
+            return (0, 0)
+
         try:
             result = subprocess.run(
                 ["curl", "-s", api_url],
@@ -8,17 +8,48 @@ Supports three modes:
 3. Fallback: Uses curl for simple fetching
 """
 
-import re
+# The third-party 'regex' module is a drop-in replacement for stdlib re
+# with a faster engine for lazy-quantifier-heavy patterns like the two
+# listing patterns below (same treatment as extract-plugins.py).
+try:
+    import regex as re
+except ImportError:
+    import re
+
 import json
 import hashlib
-import subprocess
-import asyncio
+from collections import OrderedDict
+
+# Optional fast JSON parser (pip install orjson); Crawl4AI responses
+# carry the whole page markdown, so the C parse pays off
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
 
-@dataclass
+# Compiled once; fetch_github_sha runs this per tracked repo
+_GITHUB_URL_RE = re.compile(r"github\.com/([^/]+)/([^/]+)")
+
+# Change-detection hash is non-cryptographic, so prefer xxh3 when the
+# xxhash package is installed; it is far faster than sha256 for the
+# short strings hashed here
+try:
+    from xxhash import xxh3_64_hexdigest as _fast_hash
+except ImportError:
+    def _fast_hash(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+
+@dataclass(slots=True)
 class ScrapedPlugin:
     """Raw plugin data from scraping."""
     name: str
@@ -30,9 +61,9 @@ class ScrapedPlugin:
 
     @property
     def content_hash(self) -> str:
-        """Hash of content for change detection."""
+        """Hash of content for change detection (non-cryptographic)."""
         content = f"{self.name}|{self.description}|{self.author}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        return _fast_hash(content.encode())[:16]
 
 
 class PluginScraper:
@@ -46,33 +77,58 @@ class PluginScraper:
 
     PLUGINS_URL = "https://www.sketch.com/extensions/plugins/#all"
 
-    # Regex for developer plugins
-    # Format: "### [ Plugin Name  Updated on DATE Description  by Author ](URL)"
+    # Regex for developer plugins, split into two linear stages to kill
+    # the backtracking blowup of the old single pattern (four nested lazy
+    # groups). Format:
+    # "### [ Plugin Name  Updated on DATE Description  by Author ](URL)"
+    #
+    # Stage 1 finds the bracket span. The char classes are possessive
+    # (*+ / ++, Python 3.11+): each is disjoint from the literal that
+    # follows, so the engine never backs into them and the scan stays
+    # linear even on markdown with an unclosed bracket.
     PLUGIN_PATTERN = re.compile(
-        r"\d+\.\s+###\s+\[\s*"
-        r"([^\]]+?)"           # Group 1: Plugin name
-        r"\s+Updated on "
-        r"(\d+ \w+ \d+)"       # Group 2: Date
-        r"\s+"
-        r"([^\]]+?)"           # Group 3: Description
-        r"\s+by\s+"
-        r"([^\]]+?)"           # Group 4: Author
-        r"\s*\]\("
-        r"([^)]+)"             # Group 5: URL
-        r"\)"
+        r"""
+        \d+\.\s+\#\#\#\s+
+        \[ ([^\]]*+) \]     # Group 1: bracket content (no ] inside)
+        \( ([^)]++) \)      # Group 2: URL
+        """,
+        re.VERBOSE,
     )
 
-    # Regex for official plugins
+    # Stage 2 pulls the fields out of one short bracket span. The lazy
+    # groups remain, but they now operate on tens of characters instead
+    # of the whole page, so worst-case cost is bounded.
+    PLUGIN_FIELDS_PATTERN = re.compile(
+        r"""
+        \s*
+        ([^\]]+?)           # Group 1: Plugin name
+        \s+Updated[ ]on[ ]
+        (\d+[ ]\w+[ ]\d+)   # Group 2: Date
+        \s+
+        ([^\]]+?)           # Group 3: Description
+        \s+by\s+
+        ([^\]]+?)           # Group 4: Author
+        \s*
+        """,
+        re.VERBOSE,
+    )
+
+    # Regex for official plugins (kept for parity with scrape-plugins.js;
+    # this module ships OFFICIAL_PLUGINS hardcoded instead). The image
+    # prefix is possessive for the same no-backtracking reason as above.
     OFFICIAL_PATTERN = re.compile(
-        r"\[\s*!\[[^\]]*\]\([^)]+\)\s*"
-        r"([^\s]+(?:\s+[^\s]+)*?)"  # Group 1: Name
-        r"\s+"
-        r"([^!]+?)"                  # Group 2: Description
-        r"\s+by\s+"
-        r"([^\]]+?)"                 # Group 3: Author
-        r"\s*\]\("
-        r"([^)]+)"                   # Group 4: URL
-        r"\)"
+        r"""
+        \[\s* !\[[^\]]*+\] \([^)]++\) \s*
+        ([^\s]+(?:\s+[^\s]+)*?)     # Group 1: Name
+        \s+
+        ([^!]+?)                    # Group 2: Description
+        \s+by\s+
+        ([^\]]+?)                   # Group 3: Author
+        \s*\]\(
+        ([^)]++)                    # Group 4: URL
+        \)
+        """,
+        re.VERBOSE,
     )
 
     # Official plugins (hardcoded as they rarely change)
@@ -103,8 +159,22 @@ class PluginScraper:
         ),
     ]
 
+    # Normalized keys for OFFICIAL_PLUGINS, computed once at class load
+    # so each scrape skips re-normalizing the same three links
+    _OFFICIAL_KEYS: tuple[str, ...] = tuple(
+        p.link.lower().rstrip("/") for p in OFFICIAL_PLUGINS
+    )
+
+    # Memoization bounds for scrape_from_markdown: keep a handful of
+    # parses, and never cache pages too large to be worth the memory
+    _SCRAPE_CACHE_SIZE = 16
+    _SCRAPE_CACHE_MAX_INPUT = 10_000_000
+
     def __init__(self):
         self.last_error: Optional[str] = None
+        # Parse results keyed by markdown hash; dry-run + apply in one
+        # process parse the same page twice otherwise
+        self._scrape_cache: OrderedDict[str, list[ScrapedPlugin]] = OrderedDict()
 
     def scrape_from_markdown(self, markdown: str) -> list[ScrapedPlugin]:
         """
@@ -118,31 +188,53 @@ class PluginScraper:
         Returns:
             List of ScrapedPlugin objects
         """
-        plugins = []
+        # Parsing is pure in the input, so repeated scrapes of the same
+        # page (e.g. dry-run followed by apply) answer from the memo.
+        # A fresh list is returned each time so callers can't alias the
+        # cached one.
+        cache_key = None
+        if len(markdown) <= self._SCRAPE_CACHE_MAX_INPUT:
+            cache_key = _fast_hash(markdown.encode())
+            cached = self._scrape_cache.get(cache_key)
+            if cached is not None:
+                self._scrape_cache.move_to_end(cache_key)
+                return list(cached)
+
+        # Dedup is fused into the parse loop: duplicate listings are
+        # skipped before a ScrapedPlugin is ever constructed
+        seen = set()
+        unique = []
 
-        # Parse developer plugins
+        # Parse developer plugins: locate each [content](url) span, then
+        # split the span's fields with the small anchored pattern
         for match in self.PLUGIN_PATTERN.finditer(markdown):
-            link = match.group(5).strip()
-            plugins.append(ScrapedPlugin(
-                name=match.group(1).strip(),
-                updated=match.group(2).strip(),
-                description=match.group(3).strip(),
-                author=match.group(4).strip(),
+            fields = self.PLUGIN_FIELDS_PATTERN.fullmatch(match.group(1))
+            if not fields:
+                continue
+            link = match.group(2).strip()
+            key = link.lower().rstrip("/")
+            if key in seen:
+                continue
+            seen.add(key)
+            unique.append(ScrapedPlugin(
+                name=fields.group(1).strip(),
+                updated=fields.group(2).strip(),
+                description=fields.group(3).strip(),
+                author=fields.group(4).strip(),
                 link=link,
                 is_github="github.com" in link.lower()
             ))
 
-        # Add official plugins
-        plugins.extend(self.OFFICIAL_PLUGINS)
-
-        # Deduplicate by link
-        seen = set()
-        unique = []
-        for p in plugins:
-            key = p.link.lower().rstrip("/")
+        # Add official plugins not already listed on the page
+        for plugin, key in zip(self.OFFICIAL_PLUGINS, self._OFFICIAL_KEYS):
             if key not in seen:
                 seen.add(key)
-                unique.append(p)
+                unique.append(plugin)
+
+        if cache_key is not None:
+            self._scrape_cache[cache_key] = list(unique)
+            while len(self._scrape_cache) > self._SCRAPE_CACHE_SIZE:
+                self._scrape_cache.popitem(last=False)
 
         return unique
 
@@ -159,15 +251,16 @@ class PluginScraper:
             List of ScrapedPlugin objects
         """
         try:
-            data = json.loads(json_content)
+            data = _json_loads(json_content)
             if isinstance(data, list) and len(data) > 0:
-                inner = json.loads(data[0].get("text", "{}"))
+                inner = _json_loads(data[0].get("text", "{}"))
                 markdown = inner.get("markdown", "")
                 return self.scrape_from_markdown(markdown)
             else:
                 self.last_error = "Invalid JSON structure"
                 return []
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # Covers json.JSONDecodeError and orjson.JSONDecodeError alike
             self.last_error = f"JSON decode error: {e}"
             return []
 
@@ -231,6 +324,9 @@ class PluginScraper:
 
         Convenience method for non-async contexts.
         """
+        # Deferred like the crawl4ai import above: only the scraping
+        # path pays for the asyncio machinery
+        import asyncio
         return asyncio.run(self.scrape_async())
 
     @staticmethod
@@ -238,38 +334,99 @@ class PluginScraper:
         """
         Fetch the latest commit SHA for a GitHub repo.
 
+        In-process urllib request instead of a curl subprocess: no fork
+        per lookup, and errors surface as None just as before.
+
         Args:
             repo_url: GitHub repository URL
 
         Returns:
             SHA string or None if failed
         """
-        # Extract owner/repo from URL
-        match = re.search(r"github\.com/([^/]+)/([^/]+)", repo_url)
+        sha, _etag = PluginScraper._fetch_sha_conditional(repo_url, None)
+        return sha
+
+    @staticmethod
+    def _fetch_sha_conditional(repo_url: str, cached: Optional[dict]) -> tuple[Optional[str], Optional[str]]:
+        """Fetch one repo's latest SHA, revalidating with a stored ETag.
+
+        Returns (sha, etag); a 304 answers from the cached pair without a
+        response body.
+        """
+        match = _GITHUB_URL_RE.search(repo_url)
         if not match:
-            return None
+            return None, None
 
         owner, repo = match.groups()
         repo = repo.rstrip(".git")
-
-        # Use GitHub API (no auth for public repos)
         api_url = f"https://api.github.com/repos/{owner}/{repo}/commits?per_page=1"
 
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "sketch-dev-plugin-tracker",
+        }
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+
         try:
-            result = subprocess.run(
-                ["curl", "-s", api_url],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
+            request = urllib.request.Request(api_url, headers=headers)
+            with urllib.request.urlopen(request, timeout=10) as resp:
+                data = _json_loads(resp.read())
                 if isinstance(data, list) and len(data) > 0:
-                    return data[0].get("sha")
+                    return data[0].get("sha"), resp.headers.get("ETag")
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and cached:
+                return cached.get("sha"), cached.get("etag")
         except Exception:
             pass
 
-        return None
+        return None, None
+
+    def fetch_github_shas(self, repo_urls: list[str],
+                          etag_path: Optional[str] = None) -> dict[str, Optional[str]]:
+        """
+        Fetch latest commit SHAs for many repos concurrently.
+
+        One shared thread pool replaces a curl subprocess per repo, and
+        stored ETags turn unchanged repos into bodyless 304 round trips.
+
+        Args:
+            repo_urls: GitHub repository URLs (duplicates are fetched once)
+            etag_path: Optional JSON file persisting {url: {sha, etag}}
+                       across invocations
+
+        Returns:
+            Dict mapping each input URL to its SHA (None if failed)
+        """
+        cache: dict = {}
+        if etag_path and Path(etag_path).exists():
+            try:
+                cache = _json_loads(Path(etag_path).read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                cache = {}
+
+        unique_urls = list(dict.fromkeys(repo_urls))
+        if not unique_urls:
+            return {}
+
+        def worker(url: str):
+            return url, self._fetch_sha_conditional(url, cache.get(url))
+
+        results: dict[str, Optional[str]] = {}
+        with ThreadPoolExecutor(max_workers=min(8, len(unique_urls))) as executor:
+            for url, (sha, etag) in executor.map(worker, unique_urls):
+                results[url] = sha
+                if sha and etag:
+                    cache[url] = {"sha": sha, "etag": etag}
+
+        if etag_path:
+            try:
+                Path(etag_path).write_text(
+                    json.dumps(cache, indent=2), encoding="utf-8")
+            except OSError:
+                pass
+
+        return {url: results.get(url) for url in repo_urls}
 
     @staticmethod
     def get_github_compare_url(repo_url: str, from_sha: str, to_sha: str = "HEAD") -> str:
@@ -10,10 +10,14 @@ Supports both old schema (with 'summary' field) and new schema (with
 during migration.
 """
 
+import hashlib
+import pickle
 import re
-import yaml
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, date
+from functools import cache, lru_cache
 from typing import Optional
 from pathlib import Path
 
@@ -26,10 +30,43 @@ MONTHS = {
     "jul": 7, "aug": 8, "sep": 9, "sept": 9, "oct": 10, "nov": 11, "dec": 12,
 }
 
+# Compiled once at import; _load runs these against every entry, and the
+# module-level constants skip the re-cache lookup per call
+_DATE_STRING_RE = re.compile(r"(\d{1,2})\s+(\w+)\s+(\d{4})")
+_AUTHOR_RE = re.compile(r"By\s+([^.]+)\.")
+_AUTHOR_SPLIT_RE = re.compile(r",\s*|\s+and\s+")
+_UPDATED_RE = re.compile(r"Last updated (.+)\.$")
+
+# Filename stems that don't round-trip through the generic title-case rule
+_FILENAME_MAPPINGS = {
+    "a11y": "A11y",
+    "ai": "AI",
+    "spec---measure": "SPEC / Measure",
+    "images-photos": "Images/Photos",
+    "copy-paste": "Copy/Paste",
+    "dev-tools": "Dev Tools",
+}
+
+
+@cache
+def _yaml():
+    """Import PyYAML on first use so CLI paths that never touch YAML
+    (help text, cache-hit loads) skip the import cost entirely.
+
+    Returns (module, Loader, Dumper), preferring the C-accelerated
+    libyaml classes (~10x faster parse/dump) when available.
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader, CSafeDumper as dumper
+    except ImportError:
+        from yaml import SafeLoader as loader, SafeDumper as dumper
+    return yaml, loader, dumper
+
 
 def parse_date_string(date_str: str) -> Optional[str]:
     """Parse date string like '6 Jan 2026' to '2026-01-06'."""
-    match = re.search(r"(\d{1,2})\s+(\w+)\s+(\d{4})", date_str)
+    match = _DATE_STRING_RE.search(date_str)
     if match:
         day = int(match.group(1))
         month_name = match.group(2).lower()
@@ -43,7 +80,7 @@ def parse_date_string(date_str: str) -> Optional[str]:
     return None
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginRecord:
     """Record for a single plugin with tracking metadata."""
     # Core identity
@@ -72,10 +109,21 @@ class PluginRecord:
     open_source: bool = False
     tags: list = field(default_factory=list)
 
+    # Lowercased name+description, built once at load so searches avoid
+    # re-lowercasing every record per query (NUL keeps the fields separate)
+    searchable: str = field(init=False, repr=False, compare=False)
+
+    # Normalized link, computed once instead of on every key lookup
+    _tracking_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.searchable = (self.name + "\x00" + self.description).lower()
+        self._tracking_key = self.link.lower().rstrip("/")
+
     @property
     def tracking_key(self) -> str:
         """Unique key for this plugin (normalized link)."""
-        return self.link.lower().rstrip("/")
+        return self._tracking_key
 
     @property
     def author(self) -> str:
@@ -112,13 +160,13 @@ class PluginRecord:
             updated = ""
 
             # Extract author(s)
-            author_match = re.match(r"By\s+([^.]+)\.", summary)
+            author_match = _AUTHOR_RE.match(summary)
             if author_match:
                 author_text = author_match.group(1).strip()
-                authors = [a.strip() for a in re.split(r",\s*|\s+and\s+", author_text)]
+                authors = [a.strip() for a in _AUTHOR_SPLIT_RE.split(author_text)]
 
             # Extract and convert date
-            date_match = re.search(r"Last updated (.+)\.$", summary)
+            date_match = _UPDATED_RE.search(summary)
             if date_match:
                 date_str = date_match.group(1).strip()
                 updated = parse_date_string(date_str) or date_str
@@ -207,47 +255,127 @@ class PluginState:
         self.plugins: dict[str, PluginRecord] = {}
         self._category_map: dict[str, str] = {}  # link -> category
 
-        self._load()
-
-    def _load(self):
-        """Load state from all YAML files."""
+        # Secondary indexes so status/category/github queries avoid full
+        # scans; maintained incrementally by the mutating methods
+        self._by_status: dict[WatchStatus, set[str]] = defaultdict(set)
+        self._by_category: dict[str, set[str]] = defaultdict(set)
+        self._github_keys: set[str] = set()
+
+        # Categories touched since load; save() only rewrites these
+        self._dirty_categories: set[str] = set()
+
+        # Warm runs skip YAML parsing entirely: the pickle cache is keyed
+        # by the fingerprint of every .yml file, so any edit misses it
+        if not self._load_from_cache():
+            self._load()
+            self._write_cache()
+        self._rebuild_indexes()
+
+    def _index_record(self, key: str, record: PluginRecord):
+        self._by_status[record.watch_status].add(key)
+        self._by_category[record.category].add(key)
+        if record.is_github:
+            self._github_keys.add(key)
+
+    def _unindex_record(self, key: str, record: PluginRecord):
+        self._by_status[record.watch_status].discard(key)
+        self._by_category[record.category].discard(key)
+        self._github_keys.discard(key)
+
+    def _rebuild_indexes(self):
+        """Derive the secondary indexes from self.plugins (one O(N) pass)."""
+        self._by_status.clear()
+        self._by_category.clear()
+        self._github_keys.clear()
+        for key, record in self.plugins.items():
+            self._index_record(key, record)
+
+    def _cache_path(self) -> Optional[Path]:
+        """Cache file keyed by the names/mtimes/sizes of all YAML files."""
         if not self.plugins_dir.exists():
+            return None
+        fingerprint = sorted(
+            (p.name, p.stat().st_mtime_ns, p.stat().st_size)
+            for p in self.plugins_dir.glob("*.yml")
+        )
+        digest = hashlib.sha256(repr(fingerprint).encode()).hexdigest()[:16]
+        return self.plugins_dir / ".cache" / f"state-{digest}.pkl"
+
+    def _load_from_cache(self) -> bool:
+        """Restore plugins from the pickle cache; False on any mismatch."""
+        cache_path = self._cache_path()
+        if cache_path is None or not cache_path.exists():
+            return False
+        try:
+            with open(cache_path, "rb") as f:
+                self.plugins, self._category_map = pickle.load(f)
+            return True
+        except Exception:
+            return False
+
+    def _write_cache(self):
+        """Persist the loaded state for the next invocation (best effort)."""
+        cache_path = self._cache_path()
+        if cache_path is None:
             return
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            # Earlier fingerprints are dead weight; keep only the current one
+            for stale in cache_path.parent.glob("state-*.pkl"):
+                if stale != cache_path:
+                    stale.unlink(missing_ok=True)
+            with open(cache_path, "wb") as f:
+                pickle.dump((self.plugins, self._category_map), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+
+    def _parse_file(self, yaml_file: Path) -> tuple[str, list[PluginRecord]]:
+        """Parse one category file into records (worker for _load)."""
+        category = self._filename_to_category(yaml_file.stem)
+
+        yaml, loader, _ = _yaml()
+        try:
+            # Binary mode: libyaml decodes UTF-8 itself, skipping the
+            # Python-side text-layer decode
+            with open(yaml_file, "rb") as f:
+                entries = yaml.load(f, Loader=loader)
 
-        for yaml_file in self.plugins_dir.glob("*.yml"):
-            # Derive category from filename
-            category = self._filename_to_category(yaml_file.stem)
+            records = [PluginRecord.from_yaml_entry(entry, category)
+                       for entry in entries or []]
+        except Exception as e:
+            print(f"Warning: Failed to load {yaml_file}: {e}")
+            records = []
 
-            try:
-                with open(yaml_file, "r", encoding="utf-8") as f:
-                    entries = yaml.safe_load(f)
+        return category, records
 
-                if not entries:
-                    continue
+    def _load(self):
+        """Load state from all YAML files (parsed in parallel)."""
+        if not self.plugins_dir.exists():
+            return
 
-                for entry in entries:
-                    record = PluginRecord.from_yaml_entry(entry, category)
+        files = sorted(self.plugins_dir.glob("*.yml"))
+        if not files:
+            return
+
+        # libyaml releases the GIL while parsing, so threads overlap both
+        # the file reads and the parses; the merge stays on this thread
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+            for category, records in executor.map(self._parse_file, files):
+                for record in records:
                     key = record.tracking_key
                     self.plugins[key] = record
                     self._category_map[key] = category
 
-            except Exception as e:
-                print(f"Warning: Failed to load {yaml_file}: {e}")
-
-    def _filename_to_category(self, stem: str) -> str:
+    # Both converters are pure functions over a tiny input domain (one
+    # value per category), so the lru_cache never needs invalidating and
+    # repeated load/save cycles skip the string work entirely
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _filename_to_category(stem: str) -> str:
         """Convert filename stem to category name."""
-        # Map common patterns
-        mappings = {
-            "a11y": "A11y",
-            "ai": "AI",
-            "spec---measure": "SPEC / Measure",
-            "images-photos": "Images/Photos",
-            "copy-paste": "Copy/Paste",
-            "dev-tools": "Dev Tools",
-        }
-
-        if stem in mappings:
-            return mappings[stem]
+        if stem in _FILENAME_MAPPINGS:
+            return _FILENAME_MAPPINGS[stem]
 
         # Title case with special handling
         return stem.replace("-", " ").title()
@@ -266,26 +394,53 @@ class PluginState:
         # Ensure directory exists
         self.plugins_dir.mkdir(parents=True, exist_ok=True)
 
-        # Write each category file
+        # Only categories touched since load need consideration. An
+        # untouched state still compares everything, so a bare
+        # load-then-save (e.g. schema migration) keeps working.
+        dirty = self._dirty_categories or set(by_category)
+
+        # Write each dirty category file whose content actually changed
         for category, records in by_category.items():
+            if category not in dirty:
+                continue
+
             filename = self._category_to_filename(category)
             filepath = self.plugins_dir / filename
 
+            yaml, _, dumper = _yaml()
             entries = [r.to_yaml_entry() for r in records]
+            content = "---\n" + yaml.dump(entries, Dumper=dumper,
+                                          default_flow_style=False,
+                                          allow_unicode=True, sort_keys=False)
 
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write("---\n")
-                yaml.dump(entries, f, default_flow_style=False,
-                          allow_unicode=True, sort_keys=False)
+            # Skip identical files: no mtime thrash, no write amplification
+            try:
+                if filepath.read_text(encoding="utf-8") == content:
+                    continue
+            except OSError:
+                pass
 
-    def _category_to_filename(self, category: str) -> str:
+            filepath.write_text(content, encoding="utf-8")
+
+        self._dirty_categories.clear()
+
+        # The files just changed, so re-key the warm-start cache
+        self._write_cache()
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _category_to_filename(category: str) -> str:
         """Convert category name to filename."""
         return category.lower().replace(" ", "-").replace("/", "-") + ".yml"
 
+    @staticmethod
+    def _norm(link: str) -> str:
+        """Normalize a link into its tracking key."""
+        return link.lower().rstrip("/")
+
     def get_plugin(self, link: str) -> Optional[PluginRecord]:
         """Get plugin by link."""
-        key = link.lower().rstrip("/")
-        return self.plugins.get(key)
+        return self.plugins.get(self._norm(link))
 
     def add_or_update(self, record: PluginRecord) -> bool:
         """
@@ -297,8 +452,14 @@ class PluginState:
         key = record.tracking_key
         is_new = key not in self.plugins
 
+        if not is_new:
+            old = self.plugins[key]
+            self._unindex_record(key, old)
+            self._dirty_categories.add(old.category)
         self.plugins[key] = record
         self._category_map[key] = record.category
+        self._index_record(key, record)
+        self._dirty_categories.add(record.category)
         return is_new
 
     def remove(self, link: str) -> bool:
@@ -308,8 +469,10 @@ class PluginState:
         Returns:
             True if removed, False if not found
         """
-        key = link.lower().rstrip("/")
+        key = self._norm(link)
         if key in self.plugins:
+            self._unindex_record(key, self.plugins[key])
+            self._dirty_categories.add(self.plugins[key].category)
             del self.plugins[key]
             self._category_map.pop(key, None)
             return True
@@ -317,13 +480,17 @@ class PluginState:
 
     def set_watch_status(self, link: str, status: WatchStatus):
         """Set watch status for a plugin."""
-        key = link.lower().rstrip("/")
+        key = self._norm(link)
         if key in self.plugins:
+            # Move the key between status buckets along with the change
+            self._by_status[self.plugins[key].watch_status].discard(key)
             self.plugins[key].watch_status = status
+            self._by_status[status].add(key)
+            self._dirty_categories.add(self.plugins[key].category)
 
     def get_by_status(self, status: WatchStatus) -> list[PluginRecord]:
         """Get all plugins with a specific watch status."""
-        return [p for p in self.plugins.values() if p.watch_status == status]
+        return [self.plugins[key] for key in self._by_status[status]]
 
     def get_watched(self) -> list[PluginRecord]:
         """Get all explicitly watched plugins."""
@@ -335,29 +502,24 @@ class PluginState:
 
     def get_by_category(self, category: str) -> list[PluginRecord]:
         """Get all plugins in a category."""
-        return [p for p in self.plugins.values() if p.category == category]
+        return [self.plugins[key] for key in self._by_category[category]]
 
     def get_github_plugins(self) -> list[PluginRecord]:
         """Get all GitHub-hosted plugins."""
-        return [p for p in self.plugins.values() if p.is_github]
+        return [self.plugins[key] for key in self._github_keys]
 
     def get_stats(self) -> dict:
-        """Get summary statistics."""
-        watched = sum(1 for p in self.plugins.values()
-                      if p.watch_status == WatchStatus.WATCH)
-        ignored = sum(1 for p in self.plugins.values()
-                      if p.watch_status == WatchStatus.IGNORE)
-        major_only = sum(1 for p in self.plugins.values()
-                         if p.watch_status == WatchStatus.MAJOR_ONLY)
+        """Get summary statistics (index reads, no scans)."""
+        github = len(self._github_keys)
 
         return {
             "total": len(self.plugins),
-            "watched": watched,
-            "ignored": ignored,
-            "major_only": major_only,
-            "github": sum(1 for p in self.plugins.values() if p.is_github),
-            "non_github": sum(1 for p in self.plugins.values() if not p.is_github),
-            "categories": len(set(p.category for p in self.plugins.values())),
+            "watched": len(self._by_status[WatchStatus.WATCH]),
+            "ignored": len(self._by_status[WatchStatus.IGNORE]),
+            "major_only": len(self._by_status[WatchStatus.MAJOR_ONLY]),
+            "github": github,
+            "non_github": len(self.plugins) - github,
+            "categories": sum(1 for keys in self._by_category.values() if keys),
         }
 
     def get_all_links(self) -> set[str]:
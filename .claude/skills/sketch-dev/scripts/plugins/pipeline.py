@@ -36,21 +36,27 @@ Requirements:
 """
 
 import argparse
+import hashlib
 import json
+# Optional fast JSON parser (pip install orjson) for queue loads
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+# Optional streaming parser (pip install ijson): review only prints the
+# first page of pending items, so large queues need not fully load
+try:
+    import ijson
+except ImportError:
+    ijson = None
+import os
 import sys
 from pathlib import Path
-from datetime import datetime
 
-from lib import (
-    PluginState,
-    PluginScraper,
-    PluginDiffer,
-    PluginCategorizer,
-    ReviewQueue,
-    ReviewAction,
-    ChangeType,
-    create_review_prompt,
-)
+# lib is imported inside each cmd_* function: pulling it in at module
+# scope would run the whole package __init__ (schema, scraper, differ,
+# reviewer) before argparse even sees the command, and `review`/`apply`
+# never need it at all
 
 
 def get_plugins_dir() -> Path:
@@ -60,8 +66,42 @@ def get_plugins_dir() -> Path:
     return skill_root / "references" / "plugins"
 
 
+# Fingerprint of the last fully processed scrape; lives beside the YAML
+FINGERPRINT_NAME = ".last_scrape_fp"
+
+
+def _scrape_fingerprint(scraped) -> str:
+    """Stable digest of a scrape result for upstream-change detection."""
+    payload = json.dumps(
+        [(p.name, p.link, p.description, p.author, p.updated) for p in scraped],
+        sort_keys=True,
+    ).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _last_fingerprint() -> str:
+    """Read the stored fingerprint ('' if none)."""
+    try:
+        return (get_plugins_dir() / FINGERPRINT_NAME).read_text().strip()
+    except OSError:
+        return ""
+
+
+def _store_fingerprint(fingerprint: str):
+    """Atomically persist the fingerprint of a fully processed scrape."""
+    path = get_plugins_dir() / FINGERPRINT_NAME
+    tmp = path.with_suffix(".tmp")
+    try:
+        tmp.write_text(fingerprint + "\n")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
 def cmd_stats(args):
     """Show current state statistics."""
+    from lib import PluginState
+
     state = PluginState(get_plugins_dir())
     stats = state.get_stats()
 
@@ -80,6 +120,8 @@ def cmd_stats(args):
 
 def cmd_check(args):
     """Check for updates without making changes."""
+    from lib import ChangeType, PluginDiffer, PluginScraper, PluginState
+
     state = PluginState(get_plugins_dir())
     scraper = PluginScraper()
 
@@ -126,6 +168,13 @@ def cmd_check(args):
         print("     Then: python pipeline.py check --mcp-input /path/to/result.json")
         return
 
+    # Short-circuit when the page matches the last fully processed
+    # scrape: nothing downstream can differ, so skip the diff pass
+    if _scrape_fingerprint(scraped) == _last_fingerprint():
+        print()
+        print("No upstream changes since last run.")
+        return
+
     # Diff
     differ = PluginDiffer(state)
     results = differ.diff_all(scraped)
@@ -161,6 +210,8 @@ def cmd_check(args):
 
 def cmd_run(args):
     """Run full pipeline and create review queue."""
+    from lib import PluginDiffer, PluginScraper, PluginState, ReviewQueue
+
     state = PluginState(get_plugins_dir())
     scraper = PluginScraper()
 
@@ -195,6 +246,13 @@ def cmd_run(args):
     print(f"Loaded {len(state.plugins)} existing plugins")
     print(f"Scraped {len(scraped)} plugins")
 
+    # Same short-circuit as cmd_check against the last processed scrape
+    fingerprint = _scrape_fingerprint(scraped)
+    if fingerprint == _last_fingerprint():
+        print()
+        print("No upstream changes since last run.")
+        return
+
     # Diff
     differ = PluginDiffer(state)
     results = differ.diff_all(scraped)
@@ -209,6 +267,10 @@ def cmd_run(args):
     added = queue.populate_from_diff(results)
 
     if added == 0:
+        # Only a scrape that produced no work is recorded: storing the
+        # fingerprint while a queue is pending would stop it from being
+        # regenerated if lost before apply
+        _store_fingerprint(fingerprint)
         print()
         print("No items need review. State is up to date.")
         return
@@ -225,36 +287,64 @@ def cmd_run(args):
     print(f"  2. Apply changes: python pipeline.py apply --queue {queue_path}")
 
 
+# Pending items shown by cmd_review before it stops enumerating
+REVIEW_PAGE_SIZE = 50
+
+
 def cmd_review(args):
     """Interactive review of queued items."""
     if not args.queue:
         print("Error: --queue required for 'review' command")
         sys.exit(1)
 
-    # Load queue
-    with open(args.queue, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    # With ijson the queue streams: the tiny stats header is read first,
+    # then items are enumerated lazily and enumeration stops after one
+    # page, so peak memory stays flat however large the queue grows.
+    # Without it, fall back to loading the whole document
+    if ijson is not None:
+        with open(args.queue, "rb") as f:
+            stats = next(ijson.items(f, "stats"), {})
+
+        def iter_pending():
+            with open(args.queue, "rb") as f:
+                for item in ijson.items(f, "items.item"):
+                    if not item["reviewed"]:
+                        yield item
+    else:
+        with open(args.queue, "rb") as f:
+            data = _json_loads(f.read())
+        stats = data["stats"]
 
-    print(f"Loaded queue with {data['stats']['total']} items")
-    print(f"Pending: {data['stats']['pending']}, Reviewed: {data['stats']['reviewed']}")
-    print()
+        def iter_pending():
+            return (i for i in data["items"] if not i["reviewed"])
 
-    # Show pending items
-    pending = [i for i in data["items"] if not i["reviewed"]]
-    if not pending:
-        print("No pending items to review.")
-        return
+    print(f"Loaded queue with {stats.get('total', 0)} items")
+    print(f"Pending: {stats.get('pending', 0)}, Reviewed: {stats.get('reviewed', 0)}")
+    print()
 
-    print("Pending Items:")
-    print("-" * 60)
-    for i, item in enumerate(pending, 1):
-        print(f"{i}. [{item['change_type'].upper()}] {item['plugin_name']}")
+    # Show the first page of pending items
+    shown = 0
+    for item in iter_pending():
+        if shown == 0:
+            print("Pending Items:")
+            print("-" * 60)
+        shown += 1
+        print(f"{shown}. [{item['change_type'].upper()}] {item['plugin_name']}")
         print(f"   Link: {item['plugin_link']}")
         if item.get("suggested_category"):
             print(f"   Category: {item['suggested_category']}")
         if item.get("reason"):
             print(f"   Reason: {item['reason']}")
         print()
+        if shown >= REVIEW_PAGE_SIZE:
+            remaining = stats.get("pending", 0) - shown
+            if remaining > 0:
+                print(f"  ... and {remaining} more pending")
+            break
+
+    if shown == 0:
+        print("No pending items to review.")
+        return
 
     print()
     print("To review an item with LLM, use the create_review_prompt() function")
@@ -282,6 +372,8 @@ def cmd_apply(args):
 
 def cmd_mcp_info(args):
     """Show MCP tool call information for scraping."""
+    from lib import PluginScraper
+
     scraper = PluginScraper()
     mcp_call = scraper.generate_mcp_call()
 
@@ -297,55 +389,61 @@ def cmd_mcp_info(args):
     print(f'    f: "{mcp_call["params"]["f"]}"')
 
 
-def main():
+# Dispatch table: handler plus one-line help per command. main() builds
+# a parser for only the chosen command, so an invocation never pays for
+# the argument definitions (or imports) of the other five
+COMMANDS = {
+    "stats": (cmd_stats, "Show state statistics"),
+    "check": (cmd_check, "Check for updates"),
+    "run": (cmd_run, "Run full pipeline"),
+    "review": (cmd_review, "Review queued items"),
+    "apply": (cmd_apply, "Apply reviewed changes"),
+    "mcp-info": (cmd_mcp_info, "Show MCP scraping info"),
+}
+
+
+def _build_parser(command: str) -> argparse.ArgumentParser:
+    """Build the argument parser for a single command."""
     parser = argparse.ArgumentParser(
-        description="Sketch Plugin Tracking Pipeline",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=__doc__
+        prog=f"pipeline.py {command}",
+        description=COMMANDS[command][1],
     )
+    if command in ("check", "run"):
+        parser.add_argument("--scrape", action="store_true",
+                            help="Scrape directly using Crawl4AI")
+        parser.add_argument("--mcp-input", help="Path to MCP scrape result")
+    if command == "run":
+        parser.add_argument("--queue", help="Path to save review queue")
+    if command in ("review", "apply"):
+        parser.add_argument("--queue", required=True,
+                            help="Path to review queue")
+    return parser
+
+
+def _print_usage():
+    print("Sketch Plugin Tracking Pipeline")
+    print()
+    print("Usage: pipeline.py <command> [options]")
+    print()
+    print("Commands:")
+    for name, (_, help_text) in COMMANDS.items():
+        print(f"  {name:10} {help_text}")
+    print()
+    print("Run 'pipeline.py <command> --help' for command options.")
 
-    subparsers = parser.add_subparsers(dest="command", help="Command to run")
-
-    # stats
-    p_stats = subparsers.add_parser("stats", help="Show state statistics")
-    p_stats.set_defaults(func=cmd_stats)
-
-    # check
-    p_check = subparsers.add_parser("check", help="Check for updates")
-    p_check.add_argument("--scrape", action="store_true",
-                         help="Scrape directly using Crawl4AI")
-    p_check.add_argument("--mcp-input", help="Path to MCP scrape result")
-    p_check.set_defaults(func=cmd_check)
-
-    # run
-    p_run = subparsers.add_parser("run", help="Run full pipeline")
-    p_run.add_argument("--scrape", action="store_true",
-                       help="Scrape directly using Crawl4AI")
-    p_run.add_argument("--mcp-input", help="Path to MCP scrape result")
-    p_run.add_argument("--queue", help="Path to save review queue")
-    p_run.set_defaults(func=cmd_run)
-
-    # review
-    p_review = subparsers.add_parser("review", help="Review queued items")
-    p_review.add_argument("--queue", required=True, help="Path to review queue")
-    p_review.set_defaults(func=cmd_review)
-
-    # apply
-    p_apply = subparsers.add_parser("apply", help="Apply reviewed changes")
-    p_apply.add_argument("--queue", required=True, help="Path to review queue")
-    p_apply.set_defaults(func=cmd_apply)
-
-    # mcp-info
-    p_mcp = subparsers.add_parser("mcp-info", help="Show MCP scraping info")
-    p_mcp.set_defaults(func=cmd_mcp_info)
-
-    args = parser.parse_args()
-
-    if not args.command:
-        parser.print_help()
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+
+    if command in ("-h", "--help"):
+        _print_usage()
+        return
+    if command not in COMMANDS:
+        _print_usage()
         sys.exit(1)
 
-    args.func(args)
+    args = _build_parser(command).parse_args(sys.argv[2:])
+    COMMANDS[command][0](args)
 
 
 if __name__ == "__main__":
@@ -10,7 +10,7 @@ Usage:
     python update_versions.py [--dry-run] [--github-only] [--limit N]
 
 Rate Limits:
-    - Unauthenticated: 60 requests/hour (adds 1s delay between requests)
+    - Unauthenticated: 60 requests/hour (paced to the rate-limit window)
     - With `gh` CLI: 5,000 requests/hour (recommended)
 
 To use authenticated requests, ensure `gh` CLI is installed and authenticated:
@@ -20,104 +20,508 @@ To use authenticated requests, ensure `gh` CLI is installed and authenticated:
 import argparse
 import re
 import yaml
+# C-accelerated YAML (libyaml) when available; ~10x faster parse/dump
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+import io
 import json
+import mmap
+# Optional fast JSON parser (pip install orjson); API responses and the
+# SHA cache decode through it, writes stay on stdlib for indent=2
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+import os
 import subprocess
 import time
 import shutil
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cache
 from pathlib import Path
 from typing import Optional
 
 
-# Rate limiting
-REQUEST_DELAY = 1.0  # Seconds between unauthenticated requests
 GH_CLI_AVAILABLE = shutil.which("gh") is not None
 
+# Compiled once; runs per plugin entry. The optional .git suffix and
+# #fragment are folded into the pattern, so no string post-processing
+_GH_RE = re.compile(r"github\.com/([^/]+)/([^/#]+?)(?:\.git)?(?:[#/]|$)")
 
-def check_rate_limit() -> dict:
-    """Check current GitHub API rate limit status."""
-    if GH_CLI_AVAILABLE:
+# Concurrent SHA fetches; network latency dominates, so the pool turns
+# N serial round trips into ~N/workers
+MAX_FETCH_WORKERS = 8
+
+# Concurrent per-file processing in main(); files are independent
+MAX_FILE_WORKERS = 8
+
+# Serializes each file's output block so parallel runs stay readable
+_PRINT_LOCK = threading.Lock()
+
+# Batched SHA lookups via GraphQL: aliased sub-queries per repo, chunked
+# to stay under the API's node limits
+GRAPHQL_URL = "https://api.github.com/graphql"
+GRAPHQL_CHUNK_SIZE = 100
+
+
+class RateLimiter:
+    """
+    Token bucket paced by the API's own X-RateLimit headers.
+
+    Replaces the old fixed 1s inter-request sleep: requests run at full
+    speed while budget remains, and only block (until the advertised
+    reset) once it is exhausted. Each response's headers feed the real
+    remaining/reset back in, so the pacing tracks the server's window
+    instead of assuming the worst case.
+    """
+
+    def __init__(self, remaining: int, reset: float):
+        self._lock = threading.Lock()
+        self.tokens = remaining
+        self.reset = reset
+
+    def acquire(self):
+        """Take one token, sleeping through the reset window if dry."""
+        with self._lock:
+            if self.tokens <= 0:
+                wait = self.reset - time.time()
+                if wait > 0:
+                    time.sleep(wait)
+                # Window rolled over; proceed and let the next response
+                # headers resynchronize the count
+                self.tokens = 1
+            self.tokens -= 1
+
+    def update(self, headers):
+        """Resync from a response's X-RateLimit-* headers."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        with self._lock:
+            if remaining is not None:
+                self.tokens = int(remaining)
+            if reset is not None:
+                self.reset = int(reset)
+
+
+# Installed by main() for unauthenticated runs; None means no pacing
+_rate_limiter: Optional[RateLimiter] = None
+
+# Cross-run SHA cache: repeated invocations within the TTL answer from
+# disk instead of the API
+SHA_CACHE_PATH = Path.home() / ".cache" / "sketch-dev" / "gh-sha.json"
+SHA_CACHE_TTL = 3600  # Seconds a cached SHA stays authoritative
+
+# Seconds a YAML entry's recorded SHA stays fresh (see --max-age)
+DEFAULT_MAX_AGE = 86400
+
+
+class ShaCache:
+    """
+    On-disk cache of {owner/repo: {sha, etag, fetched_at}}.
+
+    Within the TTL a cached SHA is returned without any request; after
+    it expires the stored ETag still turns the refetch into a cheap
+    conditional one. JSON rather than sqlite to match the other sidecar
+    caches in this toolchain.
+    """
+
+    def __init__(self, path: Path = SHA_CACHE_PATH, ttl: int = SHA_CACHE_TTL):
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
         try:
-            result = subprocess.run(
-                ["gh", "api", "rate_limit"],
-                capture_output=True, text=True, timeout=10
-            )
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                core = data.get("resources", {}).get("core", {})
-                return {
-                    "remaining": core.get("remaining", 0),
-                    "limit": core.get("limit", 0),
-                    "reset": core.get("reset", 0),
-                    "authenticated": core.get("limit", 0) > 60
-                }
-        except Exception:
-            pass
+            self._data = _json_loads(self.path.read_bytes())
+        except (OSError, ValueError):
+            self._data = {}
+        self._dirty = False
+
+    def get_fresh(self, repo_key: str) -> Optional[dict]:
+        """Return the cached record if it is within the TTL."""
+        with self._lock:
+            record = self._data.get(repo_key)
+            if record and time.time() - record.get("fetched_at", 0) < self.ttl:
+                return record
+        return None
 
-    # Fallback: check via curl
+    def get_etag(self, repo_key: str) -> Optional[str]:
+        """Return the stored ETag, stale or not, for conditional reuse."""
+        with self._lock:
+            record = self._data.get(repo_key)
+            return record.get("etag") if record else None
+
+    def refresh(self, repo_key: str) -> Optional[dict]:
+        """Restamp a record's TTL clock after a 304 confirms it."""
+        with self._lock:
+            record = self._data.get(repo_key)
+            if record:
+                record["fetched_at"] = int(time.time())
+                self._dirty = True
+            return record
+
+    def put(self, repo_key: str, sha: Optional[str], etag: Optional[str]):
+        """Record a fetched SHA (refreshing the TTL clock)."""
+        if not sha:
+            return
+        with self._lock:
+            self._data[repo_key] = {
+                "sha": sha, "etag": etag, "fetched_at": int(time.time())
+            }
+            self._dirty = True
+
+    def save(self):
+        """Persist to disk if anything changed this run."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self.path.write_text(
+                    json.dumps(self._data, indent=2), encoding="utf-8")
+                self._dirty = False
+            except OSError:
+                pass
+
+
+@cache
+def _get_sha_cache() -> ShaCache:
+    """Process-wide ShaCache, loaded from disk on first use."""
+    return ShaCache()
+
+
+@cache
+def _gh_token() -> Optional[str]:
+    """Discover a GitHub token once via `gh auth token` (None if absent)."""
+    if not GH_CLI_AVAILABLE:
+        return None
     try:
         result = subprocess.run(
-            ["curl", "-s", "https://api.github.com/rate_limit"],
+            ["gh", "auth", "token"],
             capture_output=True, text=True, timeout=10
         )
         if result.returncode == 0:
-            data = json.loads(result.stdout)
-            core = data.get("resources", {}).get("core", {})
-            return {
-                "remaining": core.get("remaining", 0),
-                "limit": core.get("limit", 0),
-                "reset": core.get("reset", 0),
-                "authenticated": False
-            }
+            return result.stdout.strip() or None
+    except Exception:
+        pass
+    return None
+
+
+def _api_headers() -> dict:
+    """Headers for the GitHub API, with the gh token injected if found."""
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "User-Agent": "sketch-dev-plugin-tracker",
+    }
+    token = _gh_token()
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
+
+
+def check_rate_limit() -> dict:
+    """Check current GitHub API rate limit status."""
+    try:
+        request = urllib.request.Request(
+            "https://api.github.com/rate_limit", headers=_api_headers())
+        with urllib.request.urlopen(request, timeout=10) as resp:
+            data = _json_loads(resp.read())
+        core = data.get("resources", {}).get("core", {})
+        return {
+            "remaining": core.get("remaining", 0),
+            "limit": core.get("limit", 0),
+            "reset": core.get("reset", 0),
+            # The authenticated quota is 5,000/hour vs 60
+            "authenticated": core.get("limit", 0) > 60
+        }
     except Exception:
         pass
 
     return {"remaining": 0, "limit": 60, "reset": 0, "authenticated": False}
 
 
-def fetch_github_sha(repo_url: str, use_gh_cli: bool = True) -> Optional[str]:
+def _parse_repo_url(repo_url: str) -> Optional[tuple[str, str]]:
+    """Extract (owner, repo) from a GitHub URL, or None."""
+    match = _GH_RE.search(repo_url)
+    return match.groups() if match else None
+
+
+def build_graphql_query(repos: list[tuple[str, str]]) -> str:
+    """Build one GraphQL query with an aliased sub-query per repo."""
+    parts = [
+        f"r{i}: repository(owner:{json.dumps(owner)}, name:{json.dumps(name)})"
+        "{defaultBranchRef{target{oid}}}"
+        for i, (owner, name) in enumerate(repos)
+    ]
+    return "query{" + " ".join(parts) + "}"
+
+
+def _fetch_shas_graphql(
+    repos: list[tuple[str, str]]
+) -> Optional[dict[tuple[str, str], Optional[str]]]:
     """
-    Fetch latest commit SHA for a GitHub repo.
+    Fetch default-branch head SHAs for many repos in batched GraphQL POSTs.
 
-    Args:
-        repo_url: GitHub repository URL
-        use_gh_cli: Use gh CLI for authenticated requests (recommended)
+    One POST covers up to GRAPHQL_CHUNK_SIZE repos, collapsing N REST
+    round trips (and N rate-limit units) into 1. Requires a token;
+    returns None when unauthenticated or on transport failure so the
+    caller can fall back to REST.
     """
-    match = re.search(r"github\.com/([^/]+)/([^/]+)", repo_url)
-    if not match:
+    if not _gh_token():
         return None
 
-    owner, repo = match.groups()
-    repo = repo.removesuffix(".git").split("#")[0]  # Remove .git suffix and anchors
-
-    # Try gh CLI first (authenticated, higher rate limit)
-    if use_gh_cli and GH_CLI_AVAILABLE:
+    results: dict[tuple[str, str], Optional[str]] = {}
+    for start in range(0, len(repos), GRAPHQL_CHUNK_SIZE):
+        chunk = repos[start:start + GRAPHQL_CHUNK_SIZE]
+        body = json.dumps({"query": build_graphql_query(chunk)}).encode()
+        headers = {**_api_headers(), "Content-Type": "application/json"}
         try:
-            result = subprocess.run(
-                ["gh", "api", f"repos/{owner}/{repo}/commits?per_page=1"],
-                capture_output=True, text=True, timeout=15
-            )
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                if isinstance(data, list) and len(data) > 0:
-                    return data[0].get("sha")
+            request = urllib.request.Request(GRAPHQL_URL, data=body, headers=headers)
+            with urllib.request.urlopen(request, timeout=30) as resp:
+                data = _json_loads(resp.read())
         except Exception:
-            pass
+            return None
+
+        payload = data.get("data") or {}
+        for i, key in enumerate(chunk):
+            node = payload.get(f"r{i}") or {}
+            ref = node.get("defaultBranchRef") or {}
+            target = ref.get("target") or {}
+            results[key] = target.get("oid")
+
+    return results
+
+
+def _fetch_sha_conditional(
+    repo_url: str, etag: Optional[str]
+) -> tuple[Optional[str], Optional[str], bool]:
+    """
+    Fetch a repo's latest SHA, revalidating with a stored ETag.
+
+    Returns (sha, etag, unchanged). A 304 costs no rate-limit unit and
+    comes back with unchanged=True plus the cached SHA when the cache
+    still holds one; a fresh 200 carries the new ETag.
+    """
+    parsed = _parse_repo_url(repo_url)
+    if not parsed:
+        return None, None, False
+    owner, repo = parsed
+
+    # Answer from the cross-run cache while its TTL holds; an expired
+    # record still donates its ETag for a cheap conditional refetch
+    sha_cache = _get_sha_cache()
+    repo_key = f"{owner}/{repo}"
+    cached = sha_cache.get_fresh(repo_key)
+    if cached:
+        return cached.get("sha"), cached.get("etag"), False
+    if etag is None:
+        etag = sha_cache.get_etag(repo_key)
 
-    # Fallback to curl (unauthenticated)
     api_url = f"https://api.github.com/repos/{owner}/{repo}/commits?per_page=1"
+    headers = _api_headers()
+    if etag:
+        headers["If-None-Match"] = etag
+
+    if _rate_limiter:
+        _rate_limiter.acquire()
+
     try:
-        result = subprocess.run(
-            ["curl", "-s", "-f", api_url],
-            capture_output=True, text=True, timeout=15
-        )
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
+        request = urllib.request.Request(api_url, headers=headers)
+        with urllib.request.urlopen(request, timeout=15) as resp:
+            if _rate_limiter:
+                _rate_limiter.update(resp.headers)
+            data = _json_loads(resp.read())
             if isinstance(data, list) and len(data) > 0:
-                return data[0].get("sha")
+                sha = data[0].get("sha")
+                new_etag = resp.headers.get("ETag")
+                sha_cache.put(repo_key, sha, new_etag)
+                return sha, new_etag, False
+    except urllib.error.HTTPError as e:
+        if _rate_limiter:
+            _rate_limiter.update(e.headers)
+        if e.code == 304:
+            # The ETag still matches, so whatever SHA we hold is current.
+            # Hand the cached one back (restamping its TTL clock) so
+            # single-shot callers don't read an unchanged repo as a
+            # failed fetch on every run past the cache TTL
+            record = sha_cache.refresh(repo_key)
+            sha = record.get("sha") if record else None
+            return sha, etag, True
     except Exception:
         pass
 
-    return None
+    return None, None, False
+
+
+def fetch_github_sha(repo_url: str, use_gh_cli: bool = True) -> Optional[str]:
+    """
+    Fetch latest commit SHA for a GitHub repo.
+
+    In-process urllib request (authenticated via the gh token when
+    available) instead of a gh/curl subprocess per lookup.
+
+    Args:
+        repo_url: GitHub repository URL
+        use_gh_cli: Retained for CLI compatibility; authentication now
+            depends only on whether `gh auth token` yields a token
+    """
+    sha, _etag, _unchanged = _fetch_sha_conditional(repo_url, None)
+    return sha
+
+
+def revalidate_github_shas(
+    url_etags: dict[str, Optional[str]]
+) -> dict[str, tuple[Optional[str], Optional[str], bool]]:
+    """
+    Revalidate many repos concurrently using their stored ETags.
+
+    Args:
+        url_etags: Mapping of repo URL to its stored ETag
+
+    Returns:
+        Dict mapping each URL to (sha, etag, unchanged)
+    """
+    if not url_etags:
+        return {}
+
+    def worker(item):
+        url, etag = item
+        return url, _fetch_sha_conditional(url, etag)
+
+    results = {}
+    workers = min(MAX_FETCH_WORKERS, len(url_etags))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for url, result in executor.map(worker, url_etags.items()):
+            results[url] = result
+
+    return results
+
+
+def fetch_github_shas(
+    repo_urls: list[str],
+    use_gh_cli: bool = True
+) -> dict[str, Optional[str]]:
+    """
+    Fetch latest commit SHAs for many repos concurrently.
+
+    Unauthenticated pacing is handled by the shared RateLimiter inside
+    the per-request fetch, so the pool size stays constant.
+
+    Args:
+        repo_urls: GitHub repository URLs (duplicates fetched once)
+        use_gh_cli: Passed through to fetch_github_sha
+
+    Returns:
+        Dict mapping each input URL to its SHA (None if failed)
+    """
+    unique_urls = list(dict.fromkeys(repo_urls))
+    if not unique_urls:
+        return {}
+
+    # Authenticated runs batch through GraphQL: one POST per ~100 repos
+    # instead of one REST call each. Repos still fresh in the cross-run
+    # cache never reach the query at all.
+    parsed = {url: _parse_repo_url(url) for url in unique_urls}
+    repos = list(dict.fromkeys(p for p in parsed.values() if p))
+    sha_cache = _get_sha_cache()
+    resolved: dict[tuple[str, str], Optional[str]] = {}
+    for key in repos:
+        record = sha_cache.get_fresh(f"{key[0]}/{key[1]}")
+        if record and record.get("sha"):
+            resolved[key] = record["sha"]
+
+    pending = [key for key in repos if key not in resolved]
+    graph = _fetch_shas_graphql(pending) if pending else {}
+    if graph is not None:
+        for key, sha in graph.items():
+            sha_cache.put(f"{key[0]}/{key[1]}", sha, None)
+        resolved.update(graph)
+        results = {url: resolved.get(key) if key else None
+                   for url, key in parsed.items()}
+        return {url: results.get(url) for url in repo_urls}
+
+    # REST fallback: distinct URLs can still name the same repo (e.g.
+    # monorepo entries differing only by #fragment), so fetch once per
+    # pending (owner, repo) and fan the SHA back out to every URL
+    def worker(key: tuple[str, str]):
+        return key, _fetch_sha_conditional(
+            f"https://github.com/{key[0]}/{key[1]}", None)[0]
+
+    if pending:
+        workers = min(MAX_FETCH_WORKERS, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for key, sha in executor.map(worker, pending):
+                resolved[key] = sha
+
+    results = {url: resolved.get(key) if key else None
+               for url, key in parsed.items()}
+    return {url: results.get(url) for url in repo_urls}
+
+
+def _parse_plugin_file(filepath: Path):
+    """Parse one plugin YAML file (read-only mmap into libyaml)."""
+    # Hand libyaml a read-only memory map instead of a heap copy of the
+    # file: the parser streams straight off the page cache, so peak
+    # memory during parse stays at the document size, not 2x
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ) as mm:
+            return yaml.load(mm, Loader=_YamlLoader)
+
+
+@cache
+def _load_all_files(plugins_dir: Path) -> dict:
+    """
+    Parse every *.yml under plugins_dir in one pass, cached per process.
+
+    Callers share the resulting {path: entries} dict, so the directory
+    is walked and parsed once per invocation no matter how many files
+    get processed. A rewrite pops its own key to force a fresh parse.
+    """
+    files = sorted(Path(plugins_dir).glob("*.yml"))
+    if not files:
+        return {}
+    # libyaml releases the GIL while parsing, same as PluginState._load
+    with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(files))) as executor:
+        return dict(zip(files, executor.map(_parse_plugin_file, files)))
+
+
+def scan_file(
+    filepath: Path,
+    github_only: bool = True,
+    max_age: int = DEFAULT_MAX_AGE
+) -> tuple[bool, int]:
+    """
+    Cheap pre-pass over the shared parse: decide whether a file has any
+    entry worth refreshing before update_file spins up fetch pools and
+    write machinery.
+
+    Returns (needs_refresh, skipped): skipped is the entry count to
+    report when nothing needs work, unused otherwise.
+    """
+    entries = _load_all_files(filepath.parent).get(filepath)
+    if entries is None:
+        entries = _parse_plugin_file(filepath)
+    if not entries:
+        return False, 0
+
+    now = int(time.time())
+    skipped = 0
+    for entry in entries:
+        if "github.com" not in entry.get("link", "").lower():
+            # Non-GitHub entries are never fetched (github_only or not)
+            skipped += 1
+            continue
+        version = entry.get("version", {})
+        checked_at = version.get("checked_at", 0) if isinstance(version, dict) else 0
+        if now - checked_at >= max_age:
+            return True, 0
+        skipped += 1
+    return False, skipped
 
 
 def update_file(
@@ -125,22 +529,32 @@ def update_file(
     dry_run: bool = True,
     github_only: bool = True,
     use_gh_cli: bool = True,
-    delay: float = 0.0
+    max_age: int = DEFAULT_MAX_AGE
 ) -> dict:
     """
     Update versions in a single YAML file.
 
     Returns dict with counts: updated, skipped, failed
     """
-    with open(filepath, "r", encoding="utf-8") as f:
-        entries = yaml.safe_load(f)
+    entries = _load_all_files(filepath.parent).get(filepath)
+    if entries is None:
+        entries = _parse_plugin_file(filepath)
 
     if not entries:
         return {"updated": 0, "skipped": 0, "failed": 0}
 
     stats = {"updated": 0, "skipped": 0, "failed": 0}
     modified = False
-
+    messages = []
+
+    # First pass: decide which entries need a fresh fetch and which can
+    # be revalidated against their stored ETag. Freshness is an explicit
+    # checked_at timestamp rather than the old "looks like a 40-char
+    # SHA" heuristic, so stale SHAs actually get refreshed and trimmed
+    # or mis-typed ones don't trigger perpetual refetches
+    now = int(time.time())
+    to_fetch = []
+    to_check = []
     for entry in entries:
         link = entry.get("link", "")
         is_github = "github.com" in link.lower()
@@ -150,40 +564,96 @@ def update_file(
             stats["skipped"] += 1
             continue
 
-        # Skip if already has a real version (not "unknown")
         current_version = entry.get("version", {})
         if isinstance(current_version, dict):
-            current_value = current_version.get("value", "unknown")
+            current_etag = current_version.get("etag")
+            checked_at = current_version.get("checked_at", 0)
         else:
-            current_value = str(current_version)
+            current_etag = None
+            checked_at = 0
 
-        if current_value != "unknown" and len(current_value) == 40:
-            # Already has a SHA
+        if not is_github:
             stats["skipped"] += 1
-            continue
+        elif now - checked_at < max_age:
+            # Checked recently enough; nothing to do this run
+            stats["skipped"] += 1
+        elif current_etag:
+            # Past max-age but with an ETag: a bodyless, rate-limit-free
+            # 304 confirms the SHA instead of trusting it blindly
+            to_check.append(entry)
+        else:
+            to_fetch.append(entry)
 
-        if is_github:
-            # Rate limiting delay
-            if delay > 0:
-                time.sleep(delay)
-
-            sha = fetch_github_sha(link, use_gh_cli=use_gh_cli)
-            if sha:
-                entry["version"] = {"value": sha}
-                stats["updated"] += 1
-                modified = True
-                print(f"  ✓ {entry.get('plugin', '?')}: {sha[:8]}...")
-            else:
-                stats["failed"] += 1
-                print(f"  ✗ {entry.get('plugin', '?')}: failed to fetch")
+    # Fetch fresh SHAs through one batched pool, then apply
+    shas = fetch_github_shas(
+        [entry.get("link", "") for entry in to_fetch],
+        use_gh_cli=use_gh_cli
+    )
+    for entry in to_fetch:
+        sha = shas.get(entry.get("link", ""))
+        if sha:
+            entry["version"] = {"value": sha, "checked_at": now}
+            stats["updated"] += 1
+            modified = True
+            messages.append(f"  ✓ {entry.get('plugin', '?')}: {sha[:8]}...")
         else:
+            stats["failed"] += 1
+            messages.append(f"  ✗ {entry.get('plugin', '?')}: failed to fetch")
+
+    # Revalidate entries that carry an ETag; 304s count as skipped
+    checks = revalidate_github_shas(
+        {entry.get("link", ""): entry["version"]["etag"] for entry in to_check}
+    )
+    for entry in to_check:
+        sha, etag, unchanged = checks.get(
+            entry.get("link", ""), (None, None, False))
+        # A cached answer may hand back the SHA we already hold
+        if sha and sha == entry["version"].get("value"):
+            unchanged = True
+        if unchanged:
+            # Confirmed current; restart the freshness clock so the next
+            # runs within max-age skip this entry outright
+            entry["version"]["checked_at"] = now
             stats["skipped"] += 1
+            modified = True
+        elif sha:
+            entry["version"] = {"value": sha, "etag": etag, "checked_at": now}
+            stats["updated"] += 1
+            modified = True
+            messages.append(f"  ✓ {entry.get('plugin', '?')}: {sha[:8]}... (was stale)")
+        else:
+            stats["failed"] += 1
+            messages.append(f"  ✗ {entry.get('plugin', '?')}: revalidation failed")
 
     if modified and not dry_run:
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write("---\n")
-            yaml.dump(entries, f, default_flow_style=False,
-                      allow_unicode=True, sort_keys=False)
+        # Serialize in memory first: if the output matches the on-disk
+        # bytes (e.g. a SHA collapsed back to the same value) skip the
+        # rewrite entirely; otherwise land it via tempfile + os.replace
+        # so a crash mid-write can't leave a truncated file
+        buf = io.BytesIO()
+        buf.write(b"---\n")
+        yaml.dump(entries, buf, Dumper=_YamlDumper, encoding="utf-8",
+                  default_flow_style=False,
+                  allow_unicode=True, sort_keys=False)
+        payload = buf.getvalue()
+        # The on-disk bytes are only read here, when a write is pending;
+        # the all-fresh path never materializes the file in memory
+        if payload != filepath.read_bytes():
+            tmp = filepath.with_name(filepath.name + ".tmp")
+            tmp.write_bytes(payload)
+            os.replace(tmp, filepath)
+            # Drop the stale parse so a later read sees the new bytes
+            _load_all_files(filepath.parent).pop(filepath, None)
+
+    # Emit the whole file's block atomically so concurrent workers
+    # don't interleave their lines
+    with _PRINT_LOCK:
+        print(f"{filepath.name}:")
+        for line in messages:
+            print(line)
+        if stats["updated"] == 0 and stats["failed"] == 0:
+            print("  (no updates needed)")
+        print()
 
     return stats
 
@@ -194,7 +664,7 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Rate Limits:
-  Without gh CLI: 60 requests/hour (1s delay added automatically)
+  Without gh CLI: 60 requests/hour (paced automatically)
   With gh CLI:    5,000 requests/hour (recommended)
 
 To authenticate: gh auth login
@@ -213,7 +683,10 @@ To authenticate: gh auth login
     parser.add_argument("--no-gh-cli", action="store_true",
                         help="Don't use gh CLI (use unauthenticated API)")
     parser.add_argument("--no-delay", action="store_true",
-                        help="Disable rate limit delay (may hit limits)")
+                        help="Disable rate limit pacing (may hit limits)")
+    parser.add_argument("--max-age", type=int, default=DEFAULT_MAX_AGE,
+                        help="Seconds before a recorded SHA is re-checked "
+                             f"(default: {DEFAULT_MAX_AGE}, 0 = always)")
     args = parser.parse_args()
 
     github_only = not args.all
@@ -228,7 +701,8 @@ To authenticate: gh auth login
     print(f"  Authenticated: {'Yes (gh CLI)' if rate_info['authenticated'] else 'No'}")
 
     if not rate_info['authenticated'] and not args.no_delay:
-        print(f"  Delay: {REQUEST_DELAY}s between requests (use --no-delay to disable)")
+        print("  Pacing: token bucket from X-RateLimit headers "
+              "(use --no-delay to disable)")
     print()
 
     if rate_info['remaining'] < 10 and not args.dry_run:
@@ -238,10 +712,11 @@ To authenticate: gh auth login
         print("Consider waiting or using `gh auth login` for higher limits.")
         print()
 
-    # Determine delay
-    delay = 0.0
+    # Unauthenticated runs pace against the real rate-limit window
+    # rather than a fixed inter-request sleep
+    global _rate_limiter
     if not rate_info['authenticated'] and not args.no_delay:
-        delay = REQUEST_DELAY
+        _rate_limiter = RateLimiter(rate_info['remaining'], rate_info['reset'])
 
     # Find plugins directory
     skill_root = Path(__file__).parent.parent.parent
@@ -254,7 +729,9 @@ To authenticate: gh auth login
     if args.file:
         files = [Path(args.file)]
     else:
-        files = sorted(plugins_dir.glob("*.yml"))
+        # Prewarm the shared parse cache in one pass so the worker
+        # threads below don't each race to bulk-load the directory
+        files = sorted(_load_all_files(plugins_dir))
 
     print(f"GitHub only: {github_only}")
     if args.limit:
@@ -262,29 +739,50 @@ To authenticate: gh auth login
     print()
 
     total_stats = {"updated": 0, "skipped": 0, "failed": 0}
-    update_count = 0
 
-    for filepath in files:
-        if args.limit and update_count >= args.limit:
-            break
+    def accumulate(stats: dict):
+        total_stats["updated"] += stats["updated"]
+        total_stats["skipped"] += stats["skipped"]
+        total_stats["failed"] += stats["failed"]
 
-        print(f"{filepath.name}:")
-        stats = update_file(
+    def process_file(filepath: Path) -> dict:
+        # All-fresh files resolve in the scan pre-pass: no fetch pools,
+        # no serialization, no per-file output block
+        needs_refresh, skipped = scan_file(
+            filepath, github_only=github_only, max_age=args.max_age)
+        if not needs_refresh:
+            return {"updated": 0, "skipped": skipped, "failed": 0}
+        return update_file(
             filepath,
             dry_run=args.dry_run,
             github_only=github_only,
             use_gh_cli=use_gh_cli,
-            delay=delay
+            max_age=args.max_age
         )
 
-        total_stats["updated"] += stats["updated"]
-        total_stats["skipped"] += stats["skipped"]
-        total_stats["failed"] += stats["failed"]
-        update_count += stats["updated"]
-
-        if stats["updated"] == 0 and stats["failed"] == 0:
-            print("  (no updates needed)")
-        print()
+    if args.limit:
+        # Sequential keeps --limit's early stop exact
+        update_count = 0
+        for filepath in files:
+            if update_count >= args.limit:
+                break
+            stats = process_file(filepath)
+            accumulate(stats)
+            update_count += stats["updated"]
+    else:
+        # Files are independent, so process them concurrently; each
+        # file's fetches already batch inside update_file, and the
+        # shared RateLimiter gates unauthenticated requests globally
+        with ThreadPoolExecutor(max_workers=MAX_FILE_WORKERS) as executor:
+            futures = [
+                executor.submit(process_file, filepath)
+                for filepath in files
+            ]
+            for future in as_completed(futures):
+                accumulate(future.result())
+
+    # Persist any SHAs learned this run for the next invocation
+    _get_sha_cache().save()
 
     print("=" * 50)
     print(f"Updated: {total_stats['updated']}")